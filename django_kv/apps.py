@@ -19,6 +19,8 @@ class DjangoKvConfig(AppConfig):
         # Automatically wire OTEL instrumentation if enabled.
         from django_kv import observability
 
+        # Load DJANGO_KV_OTEL before any backend exists so session_span & co. are live
+        observability._load_config()
         observability.auto_instrument_django()
 
         # Validate settings
@@ -2,9 +2,29 @@
 Base async cache backend class for Django 5.1+ async cache integration.
 """
 
+import asyncio
+import base64
+import concurrent.futures
+import os
 import pickle
 import json
-from typing import Any, Optional, Dict, List, TYPE_CHECKING
+import threading
+from typing import Any, Optional, Dict, Iterable, List, Tuple, TYPE_CHECKING
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - optional dependency
+    ormsgpack = None  # type: ignore
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    zstd = None  # type: ignore
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore
 
 try:
     from key_value.aio.protocols.key_value import AsyncKeyValue
@@ -42,6 +62,21 @@ except ImportError:
                 self, keys: List[str], collection: Optional[str] = None
             ) -> int: ...
 
+            # Optional: True if values may carry raw bytes (otherwise they must be JSON-safe)
+            accepts_bytes: bool
+
+            # Optional: existence check that avoids transferring the value
+            async def exists(self, key: str, collection: Optional[str] = None) -> bool: ...
+
+            # Optional: atomic set-if-missing, returning whether the value was stored
+            async def put_if_absent(
+                self,
+                key: str,
+                value: Dict[str, Any],
+                collection: Optional[str] = None,
+                ttl: Optional[float] = None,
+            ) -> bool: ...
+
     else:
         AsyncKeyValue = Any  # type: ignore
 
@@ -49,8 +84,143 @@ from django.core.cache.backends.base import BaseCache
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
 from django.utils.encoding import force_str
 
+from django_kv import observability
+from django_kv.backends.base import _msgpack_coerced
+from django_kv.encryption import wrap_async_with_fernet
 from django_kv.observability import cache_span, record_cache_metrics
 
+# Bound once so the (de)serialization hot paths skip the module attribute lookups
+_pickle_dumps = pickle.dumps
+_pickle_loads = pickle.loads
+_json_dumps = json.dumps
+_b64encode = base64.b64encode
+_b64decode = base64.b64decode
+_bytes_fromhex = bytes.fromhex
+
+# Types ormsgpack would otherwise coerce lossily (datetime -> str, tuple -> list,
+# str subclasses -> str, ...) are passed through so they fall back to pickle.
+_MSGPACK_OPTIONS = (
+    ormsgpack.OPT_PASSTHROUGH_BIG_INT
+    | ormsgpack.OPT_PASSTHROUGH_DATACLASS
+    | ormsgpack.OPT_PASSTHROUGH_DATETIME
+    | ormsgpack.OPT_PASSTHROUGH_ENUM
+    | ormsgpack.OPT_PASSTHROUGH_SUBCLASS
+    | ormsgpack.OPT_PASSTHROUGH_TUPLE
+    | ormsgpack.OPT_PASSTHROUGH_UUID
+    if ormsgpack is not None
+    else 0
+)
+
+
+# Exact types stored as-is: the store's JSON encoding round-trips them unchanged
+_JSON_FAST_TYPES = frozenset((str, int, float, bool, type(None)))
+
+DEFAULT_COMPRESSION: Dict[str, Any] = {
+    "threshold": 1024,
+    "level": 3,
+}
+
+
+def _zstd_compress(data: bytes, level: int) -> bytes:
+    if zstd is not None:
+        return zstd.compress(data, level=level)
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    if zstd is not None:
+        return zstd.decompress(data)
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+def _make_fernet_wrapper(backend: Any, store: Any, config: Dict[str, Any]) -> Any:
+    return wrap_async_with_fernet(store, key=config.get("key"))
+
+
+def _make_zstd_wrapper(backend: Any, store: Any, config: Dict[str, Any]) -> Any:
+    # Compression is applied by _serialize rather than by wrapping the store
+    backend._configure_compression(config)
+    return store
+
+
+# Wrapper type -> factory(backend, store, config) returning the (possibly wrapped) store
+_WRAPPER_REGISTRY = {
+    "encryption": _make_fernet_wrapper,
+    "compression": _make_zstd_wrapper,
+}
+
+
+# Seconds a sync wrapper waits for the background loop before giving up (SYNC_TIMEOUT)
+DEFAULT_SYNC_TIMEOUT = 30.0
+
+
+# Persistent event loop the sync wrappers submit to, so store connections and caches
+# survive across calls. Started on first sync call; reset in forked children.
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _reset_sync_loop() -> None:
+    global _sync_loop, _sync_loop_lock
+    _sync_loop = None
+    _sync_loop_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sync_loop)
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    global _sync_loop
+    if _sync_loop is None:
+        with _sync_loop_lock:
+            if _sync_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="django-kv-sync-loop", daemon=True
+                ).start()
+                _sync_loop = loop
+    return _sync_loop
+
+
+def _run_sync(coro: Any, timeout: Optional[float] = DEFAULT_SYNC_TIMEOUT) -> Any:
+    """
+    Run a coroutine on the background loop and wait for its result.
+
+    Waits at most ``timeout`` seconds (None waits indefinitely), then cancels the
+    coroutine and raises TimeoutError so a stalled store call can't hang the caller.
+
+    The coroutine runs on the shared background loop, not the caller's, so stores whose
+    clients are bound to the loop they were created on (e.g. a redis.asyncio connection
+    pool) can't be shared between the sync and async APIs.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        future = asyncio.run_coroutine_threadsafe(coro, _get_sync_loop())
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(
+                f"Cache operation did not complete within {timeout} seconds"
+            ) from None
+    coro.close()
+    raise RuntimeError(
+        "Sync cache methods cannot be called from a running event loop; "
+        "use the async methods (aget, aset, adelete, ...) instead"
+    )
+
+
+def _decode_pickle(data: Any) -> Any:
+    if isinstance(data, bytes):
+        return _pickle_loads(data)
+    # Pickles (protocol >= 2) start with b"\x80": "80..." when hex-encoded by older
+    # releases, "g..." when base64-encoded.
+    if data.startswith("80"):
+        return _pickle_loads(_bytes_fromhex(data))
+    return _pickle_loads(_b64decode(data))
+
 
 class AsyncKeyValueCacheBackend(BaseCache):
     """
@@ -95,11 +265,32 @@ class AsyncKeyValueCacheBackend(BaseCache):
 
         super().__init__(params)
 
+        # TTL used when callers pass DEFAULT_TIMEOUT (Django's TIMEOUT setting)
+        self._default_ttl_float = (
+            float(self.default_timeout) if self.default_timeout is not None else None
+        )
+
+        # Prefix and version stay in the key unless per-version collections are requested
+        self._flat_keys = not params.get("COLLECTION_PER_VERSION", False)
+
+        # Longest a sync wrapper waits on the background loop (None waits indefinitely)
+        self._sync_timeout = params.get("SYNC_TIMEOUT", DEFAULT_SYNC_TIMEOUT)
+        self._default_coll: Optional[Tuple[int, str]] = None
+
+        # Values are only compressed once a COMPRESSION config or wrapper enables it
+        self._compress_threshold: Optional[int] = None
+        self._compress_level = DEFAULT_COMPRESSION["level"]
+        compression = params.get("COMPRESSION")
+        if compression:
+            self._configure_compression(compression)
+
         # Apply wrappers to the key_value store
         self.key_value = self._apply_wrappers(key_value, wrappers)
         self.collection = collection
         self.backend_name = self.__class__.__name__
         self._validate_backend()
+        # Resolve DJANGO_KV_OTEL now so observability.TRACING_ENABLED is current
+        observability._load_config()
 
     def _apply_wrappers(self, store: AsyncKeyValue, wrappers: Optional[list]) -> AsyncKeyValue:
         """
@@ -121,68 +312,206 @@ class AsyncKeyValueCacheBackend(BaseCache):
                 raise ValueError(f"Wrapper config must be a dict, got {type(wrapper_config)}")
 
             wrapper_type = wrapper_config.get("type")
-            if wrapper_type == "encryption":
-                from django_kv.encryption import wrap_async_with_fernet
-
-                key = wrapper_config.get("key")
-                store = wrap_async_with_fernet(store, key=key)
-            elif wrapper_type == "compression":
-                # Future: add compression wrapper support
-                pass
-            else:
-                raise ValueError(f"Unknown wrapper type: {wrapper_type}")
+            try:
+                make_wrapper = _WRAPPER_REGISTRY[wrapper_type]
+            except (KeyError, TypeError):
+                raise ValueError(f"Unknown wrapper type: {wrapper_type}") from None
+            store = make_wrapper(self, store, wrapper_config)
 
         return store
 
+    def _configure_compression(self, config: Dict[str, Any]) -> None:
+        """
+        Enable zstd compression of serialized values.
+
+        Args:
+            config: Compression settings, e.g. {'threshold': 1024, 'level': 3}.
+                Payloads of at least ``threshold`` bytes are compressed.
+        """
+        if zstd is None and zstandard is None:
+            raise ImportError(
+                "zstd compression requires Python 3.14+ or the zstandard package: "
+                "pip install django-kv[zstd]"
+            )
+        if not isinstance(config, dict):
+            config = {}
+        self._compress_threshold = int(config.get("threshold", DEFAULT_COMPRESSION["threshold"]))
+        self._compress_level = int(config.get("level", DEFAULT_COMPRESSION["level"]))
+
     def _validate_backend(self):
         """Validate that the backend implements required async methods."""
         required_methods = ["get", "put", "delete"]
         for method in required_methods:
             if not hasattr(self.key_value, method):
                 raise AttributeError(f"AsyncKeyValue store must implement {method} method")
+        # Optional atomic primitives used when the store provides them
+        self._has_put_if_absent = hasattr(self.key_value, "put_if_absent")
+        self._has_exists = hasattr(self.key_value, "exists")
+        # Stores persisting JSON need binary payloads base64-encoded; stores advertising
+        # accepts_bytes get them raw
+        self._store_accepts_bytes = bool(getattr(self.key_value, "accepts_bytes", False))
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @version.setter
+    def version(self, value: int) -> None:
+        # BaseCache assigns version in __init__; rebuild the key prefixes derived from it
+        # here so key construction never formats the version per call.
+        self._version = value
+        self._default_key_prefix_str = f"{self.key_prefix}:{value}:"
 
     def _make_key(self, key: str, version: Optional[int] = None) -> str:
         """Construct the cache key with versioning."""
-        key = force_str(key)
+        if type(key) is not str:
+            key = force_str(key)
         if version is None:
-            version = self.version
-        return f"{self.key_prefix}:{version}:{key}"
+            return self._default_key_prefix_str + key
+        return self.key_prefix + ":" + str(version) + ":" + key
 
-    def _serialize(self, value: Any) -> Dict[str, Any]:
-        """Serialize a value for storage."""
+    def _make_key_fast(self, key: str, version: Optional[int] = None) -> str:
+        """
+        Build the key passed to the store.
+
+        The key prefix and version are encoded into the key as _make_key does,
+        concatenating directly for str keys at the default version. With
+        COLLECTION_PER_VERSION they live in the collection (see _coll) and the raw key
+        is sent as-is.
+        """
+        if not self._flat_keys:
+            return key if type(key) is str else force_str(key)
+        if version is None and type(key) is str:
+            return self._default_key_prefix_str + key
+        return self._make_key(key, version)
+
+    def _make_keys(self, keys: Iterable[Any], version: Optional[int] = None) -> List[str]:
+        """Build store keys for a batch, concatenating str keys in C via map()."""
+        if not self._flat_keys:
+            prefix = ""
+        elif version is None:
+            prefix = self._default_key_prefix_str
+        else:
+            prefix = self.key_prefix + ":" + str(version) + ":"
         try:
-            json.dumps(value)
+            return list(map(prefix.__add__, keys))
+        except TypeError:
+            return [prefix + force_str(key) for key in keys]
+
+    def _coll(self, version: Optional[int] = None) -> str:
+        """Return the store collection holding keys of the given version."""
+        if self._flat_keys:
+            return self.collection
+        if version is None:
+            version = self._version
+        cached = self._default_coll
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        coll = f"{self.collection}:{self.key_prefix}:{version}"
+        # Only the default version is memoized; arbitrary versions must not grow state
+        if version == self._version:
+            self._default_coll = (version, coll)
+        return coll
+
+    def _ttl(self, timeout: Any) -> Optional[float]:
+        """Resolve a Django timeout (or DEFAULT_TIMEOUT) to a TTL in seconds; None = no expiry."""
+        if timeout is DEFAULT_TIMEOUT:
+            return self._default_ttl_float
+        if timeout is None:
+            return None
+        return float(timeout)
+
+    def _serialize(self, value: Any) -> Dict[str, Any]:
+        """
+        Serialize a value for storage.
+
+        With ormsgpack installed, values are packed to msgpack in a single pass and
+        anything msgpack can't represent faithfully falls back to pickle. Payloads
+        above the compression threshold are zstd-compressed. Binary payloads are
+        base64-encoded unless the store accepts raw bytes (py-key-value stores persist
+        JSON documents). Plain scalars skip encoding and are stored as-is.
+        """
+        value_type = type(value)
+        if value_type in _JSON_FAST_TYPES and not (
+            value_type is str
+            and self._compress_threshold is not None
+            and len(value) >= self._compress_threshold
+        ):
             return {"type": "json", "data": value}
-        except (TypeError, ValueError):
-            return {"type": "pickle", "data": pickle.dumps(value).hex()}
+        payload = None
+        if ormsgpack is not None:
+            try:
+                payload = ormsgpack.packb(value, option=_MSGPACK_OPTIONS)
+                data_type = "msgpack"
+            except ormsgpack.MsgpackEncodeError:
+                pass
+            else:
+                # bytearray/memoryview would come back as bytes
+                if _msgpack_coerced(value, payload):
+                    payload = None
+        else:
+            try:
+                _json_dumps(value)
+                return {"type": "json", "data": value}
+            except (TypeError, ValueError):
+                pass
+        if payload is None:
+            payload = _pickle_dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            data_type = "pickle"
+        if self._compress_threshold is not None and len(payload) >= self._compress_threshold:
+            payload = _zstd_compress(payload, self._compress_level)
+            data_type = "zstd+" + data_type
+        if not self._store_accepts_bytes:
+            payload = _b64encode(payload).decode("ascii")
+        return {"type": data_type, "data": payload}
 
     def _deserialize(self, stored: Dict[str, Any]) -> Any:
         """Deserialize a stored value."""
         if not stored:
             return None
-        data_type = stored.get("type")
-        data = stored.get("data")
+        try:
+            data_type = stored["type"]
+        except KeyError:
+            return stored
         if data_type == "json":
-            return data
-        elif data_type == "pickle":
-            return pickle.loads(bytes.fromhex(data))
+            return stored["data"]
+        data = stored.get("data")
+        if data_type == "pickle":
+            return _decode_pickle(data)
+        elif data_type in ("msgpack", "zstd+msgpack", "zstd+pickle"):
+            payload = data if isinstance(data, bytes) else _b64decode(data)
+            if data_type.startswith("zstd+"):
+                if zstd is None and zstandard is None:
+                    raise ImportError("zstd is required to read compressed cache values")
+                payload = _zstd_decompress(payload)
+                if data_type == "zstd+pickle":
+                    return _pickle_loads(payload)
+            if ormsgpack is None:
+                raise ImportError("ormsgpack is required to read msgpack-encoded cache values")
+            return ormsgpack.unpackb(payload)
         else:
             return stored
 
     async def aget(self, key: str, version: Optional[int] = None, default: Any = None) -> Any:
         """Async retrieve a value from the cache."""
-        cache_key = self._make_key(key, version)
+        cache_key = self._make_key_fast(key, version)
+        if not observability.TRACING_ENABLED:
+            try:
+                result = await self.key_value.get(key=cache_key, collection=self._coll(version))
+            except Exception:
+                return default
+            return default if result is None else self._deserialize(result)
         with cache_span(
             "get", self.backend_name, self.collection, {"django_kv.cache.key": cache_key}
         ) as span:
             try:
-                result = await self.key_value.get(key=cache_key, collection=self.collection)
+                result = await self.key_value.get(key=cache_key, collection=self._coll(version))
             except Exception:
                 record_cache_metrics("get", self.backend_name, error=True)
                 return default
-        hit = result is not None
-        if span:
-            span.set_attribute("django_kv.cache.hit", hit)
+            hit = result is not None
+            if span:
+                span.set_attribute("django_kv.cache.hit", hit)
         record_cache_metrics("get", self.backend_name, hit=hit)
         if result is None:
             return default
@@ -196,36 +525,49 @@ class AsyncKeyValueCacheBackend(BaseCache):
         version: Optional[int] = None,
     ) -> None:
         """Async store a value in the cache."""
-        cache_key = self._make_key(key, version)
+        cache_key = self._make_key_fast(key, version)
         serialized = self._serialize(value)
-        ttl = float(timeout) if timeout is not None else None
+        ttl = self._ttl(timeout)
+        if not observability.TRACING_ENABLED:
+            try:
+                await self.key_value.put(
+                    key=cache_key, value=serialized, collection=self._coll(version), ttl=ttl
+                )
+            except Exception:
+                pass
+            return
         with cache_span(
             "set", self.backend_name, self.collection, {"django_kv.cache.key": cache_key}
         ) as span:
             try:
                 await self.key_value.put(
-                    key=cache_key, value=serialized, collection=self.collection, ttl=ttl
+                    key=cache_key, value=serialized, collection=self._coll(version), ttl=ttl
                 )
             except Exception:
                 record_cache_metrics("set", self.backend_name, error=True)
                 return
-        if span:
-            span.set_attribute("django_kv.cache.ttl", ttl if ttl is not None else -1)
+            if span:
+                span.set_attribute("django_kv.cache.ttl", ttl if ttl is not None else -1)
         record_cache_metrics("set", self.backend_name)
 
     async def adelete(self, key: str, version: Optional[int] = None) -> bool:
         """Async delete a key from the cache."""
-        cache_key = self._make_key(key, version)
+        cache_key = self._make_key_fast(key, version)
+        if not observability.TRACING_ENABLED:
+            try:
+                return await self.key_value.delete(key=cache_key, collection=self._coll(version))
+            except Exception:
+                return False
         with cache_span(
             "delete", self.backend_name, self.collection, {"django_kv.cache.key": cache_key}
         ) as span:
             try:
-                result = await self.key_value.delete(key=cache_key, collection=self.collection)
+                result = await self.key_value.delete(key=cache_key, collection=self._coll(version))
             except Exception:
                 record_cache_metrics("delete", self.backend_name, error=True)
                 return False
-        if span:
-            span.set_attribute("django_kv.cache.deleted", result)
+            if span:
+                span.set_attribute("django_kv.cache.deleted", result)
         record_cache_metrics("delete", self.backend_name, hit=result)
         return result
 
@@ -236,28 +578,96 @@ class AsyncKeyValueCacheBackend(BaseCache):
         timeout: Optional[int] = DEFAULT_TIMEOUT,
         version: Optional[int] = None,
     ) -> bool:
-        """Async add a key only if it doesn't already exist."""
-        cache_key = self._make_key(key, version)
-        existing = await self.key_value.get(key=cache_key, collection=self.collection)
-        if existing is not None:
-            return False
-        await self.aset(key, value, timeout, version)
-        return True
+        """
+        Async add a key only if it doesn't already exist.
+
+        Uses the store's atomic ``put_if_absent`` when available (one round-trip).
+        Otherwise falls back to a get followed by a set, which is not atomic: a
+        concurrent writer may set the key between the two calls.
+        """
+        cache_key = self._make_key_fast(key, version)
+        if not self._has_put_if_absent:
+            existing = await self.key_value.get(key=cache_key, collection=self._coll(version))
+            if existing is not None:
+                return False
+            await self.aset(key, value, timeout, version)
+            return True
+
+        serialized = self._serialize(value)
+        ttl = self._ttl(timeout)
+        if not observability.TRACING_ENABLED:
+            try:
+                return await self.key_value.put_if_absent(
+                    key=cache_key, value=serialized, collection=self._coll(version), ttl=ttl
+                )
+            except Exception:
+                return False
+        with cache_span(
+            "add", self.backend_name, self.collection, {"django_kv.cache.key": cache_key}
+        ) as span:
+            try:
+                added = await self.key_value.put_if_absent(
+                    key=cache_key, value=serialized, collection=self._coll(version), ttl=ttl
+                )
+            except Exception:
+                record_cache_metrics("add", self.backend_name, error=True)
+                return False
+            if span:
+                span.set_attribute("django_kv.cache.added", added)
+        record_cache_metrics("add", self.backend_name)
+        return added
+
+    async def aget_or_set(
+        self,
+        key: str,
+        default: Any,
+        timeout: Optional[int] = DEFAULT_TIMEOUT,
+        version: Optional[int] = None,
+    ) -> Any:
+        """
+        Async fetch a key, storing ``default`` (called first if callable) on a miss.
+
+        The miss path stores through aadd, so with a put_if_absent store it costs a
+        single extra round-trip. The stored value is only re-read when another writer
+        won the race.
+        """
+        value = await self.aget(key, version, self._missing_key)
+        if value is not self._missing_key:
+            return value
+        if callable(default):
+            default = default()
+        if await self.aadd(key, default, timeout, version):
+            return default
+        return await self.aget(key, version, default)
 
     async def aget_many(self, keys: List[str], version: Optional[int] = None) -> Dict[str, Any]:
-        """Async retrieve multiple values from the cache."""
+        """
+        Async retrieve multiple values from the cache.
+
+        Relies on the AsyncKeyValue contract that get_many returns one entry per key,
+        in order.
+        """
         if not keys:
             return {}
-        cache_keys = [self._make_key(key, version) for key in keys]
+        cache_keys = self._make_keys(keys, version)
+        if not observability.TRACING_ENABLED:
+            try:
+                results = await self.key_value.get_many(
+                    keys=cache_keys, collection=self._coll(version)
+                )
+                deser = self._deserialize
+                return {k: deser(r) for k, r in zip(keys, results) if r is not None}
+            except Exception:
+                return {}
         with cache_span(
             "get_many", self.backend_name, self.collection, {"django_kv.cache.key_count": len(keys)}
         ) as span:
             try:
-                results = await self.key_value.get_many(keys=cache_keys, collection=self.collection)
-                output = {}
-                for i, key in enumerate(keys):
-                    if i < len(results) and results[i] is not None:
-                        output[key] = self._deserialize(results[i])
+                results = await self.key_value.get_many(
+                    keys=cache_keys, collection=self._coll(version)
+                )
+                deser = self._deserialize
+                output = {k: deser(r) for k, r in zip(keys, results) if r is not None}
                 hit_count = len(output)
                 miss_count = len(keys) - hit_count
                 if span:
@@ -280,31 +690,49 @@ class AsyncKeyValueCacheBackend(BaseCache):
         """Async store multiple values in the cache."""
         if not data:
             return
-        cache_keys = []
-        serialized_values = []
-        for key, value in data.items():
-            cache_keys.append(self._make_key(key, version))
-            serialized_values.append(self._serialize(value))
-        ttl = float(timeout) if timeout is not None else None
+        ser = self._serialize
+        cache_keys = self._make_keys(data, version)
+        serialized_values = [ser(value) for value in data.values()]
+        ttl = self._ttl(timeout)
+        if not observability.TRACING_ENABLED:
+            try:
+                await self.key_value.put_many(
+                    keys=cache_keys,
+                    values=serialized_values,
+                    collection=self._coll(version),
+                    ttl=ttl,
+                )
+            except Exception:
+                pass
+            return
         with cache_span(
             "set_many", self.backend_name, self.collection, {"django_kv.cache.key_count": len(data)}
         ) as span:
             try:
                 await self.key_value.put_many(
-                    keys=cache_keys, values=serialized_values, collection=self.collection, ttl=ttl
+                    keys=cache_keys,
+                    values=serialized_values,
+                    collection=self._coll(version),
+                    ttl=ttl,
                 )
             except Exception:
                 record_cache_metrics("set_many", self.backend_name, error=True)
                 return
-        if span:
-            span.set_attribute("django_kv.cache.ttl", ttl if ttl is not None else -1)
+            if span:
+                span.set_attribute("django_kv.cache.ttl", ttl if ttl is not None else -1)
         record_cache_metrics("set_many", self.backend_name)
 
     async def adelete_many(self, keys: List[str], version: Optional[int] = None) -> None:
         """Async delete multiple keys from the cache."""
         if not keys:
             return
-        cache_keys = [self._make_key(key, version) for key in keys]
+        cache_keys = self._make_keys(keys, version)
+        if not observability.TRACING_ENABLED:
+            try:
+                await self.key_value.delete_many(keys=cache_keys, collection=self._coll(version))
+            except Exception:
+                pass
+            return
         with cache_span(
             "delete_many",
             self.backend_name,
@@ -312,32 +740,34 @@ class AsyncKeyValueCacheBackend(BaseCache):
             {"django_kv.cache.key_count": len(keys)},
         ):
             try:
-                await self.key_value.delete_many(keys=cache_keys, collection=self.collection)
+                await self.key_value.delete_many(keys=cache_keys, collection=self._coll(version))
             except Exception:
                 record_cache_metrics("delete_many", self.backend_name, error=True)
                 return
         record_cache_metrics("delete_many", self.backend_name)
 
     async def ahas_key(self, key: str, version: Optional[int] = None) -> bool:
-        """Async check if a key exists in the cache."""
-        cache_key = self._make_key(key, version)
+        """
+        Async check if a key exists in the cache.
+
+        Uses the store's ``exists`` when available so the value isn't transferred.
+        """
+        cache_key = self._make_key_fast(key, version)
         try:
-            result = await self.key_value.get(key=cache_key, collection=self.collection)
+            if self._has_exists:
+                return await self.key_value.exists(key=cache_key, collection=self._coll(version))
+            result = await self.key_value.get(key=cache_key, collection=self._coll(version))
             return result is not None
         except Exception:
             return False
 
-    # Sync methods delegate to async (for compatibility)
+    # Sync methods delegate to async (for compatibility) by running on a shared background
+    # event loop, waiting at most SYNC_TIMEOUT seconds. They raise RuntimeError from a
+    # running event loop; use the a* methods. Only stores whose clients aren't bound to one
+    # event loop can be used through both the sync and async methods.
     def get(self, key: str, version: Optional[int] = None, default: Any = None) -> Any:
         """Sync wrapper around aget."""
-        import asyncio
-
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop.run_until_complete(self.aget(key, version, default))
+        return _run_sync(self.aget(key, version, default), self._sync_timeout)
 
     def set(
         self,
@@ -347,22 +777,8 @@ class AsyncKeyValueCacheBackend(BaseCache):
         version: Optional[int] = None,
     ) -> None:
         """Sync wrapper around aset."""
-        import asyncio
-
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        loop.run_until_complete(self.aset(key, value, timeout, version))
+        _run_sync(self.aset(key, value, timeout, version), self._sync_timeout)
 
     def delete(self, key: str, version: Optional[int] = None) -> bool:
         """Sync wrapper around adelete."""
-        import asyncio
-
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop.run_until_complete(self.adelete(key, version))
+        return _run_sync(self.adelete(key, version), self._sync_timeout)
@@ -4,12 +4,18 @@ Async in-memory cache backend using py-key-value-aio MemoryStore.
 
 from django_kv.backends.async_base import AsyncKeyValueCacheBackend
 
+from functools import lru_cache
 from pathlib import Path
 import sys
 
 
-def _load_async_memory_store():
-    """Load AsyncMemoryStore from py-key-value-aio, adding vendored paths if needed."""
+@lru_cache(maxsize=1)
+def _resolve_store():
+    """
+    Load AsyncMemoryStore from py-key-value-aio, adding vendored paths if needed.
+
+    Resolved on first backend instantiation rather than at import, and memoized.
+    """
     try:
         from key_value.aio.stores.memory import MemoryStore as _AsyncMemoryStore  # type: ignore
 
@@ -20,9 +26,10 @@ def _load_async_memory_store():
             repo_root / "external" / "py-key-value" / "key-value" / "key-value-aio" / "src",
             repo_root / "external" / "py-key-value" / "key-value" / "key-value-shared" / "src",
         ]
+        on_path = set(sys.path)
         added = False
         for path in candidate_paths:
-            if path.exists() and str(path) not in sys.path:
+            if str(path) not in on_path and path.exists():
                 sys.path.insert(0, str(path))
                 added = True
         if added:
@@ -32,12 +39,6 @@ def _load_async_memory_store():
         raise
 
 
-try:
-    AsyncMemoryStore = _load_async_memory_store()
-except ImportError:
-    AsyncMemoryStore = None  # type: ignore
-
-
 class AsyncMemoryCacheBackend(AsyncKeyValueCacheBackend):
     """
     Django async cache backend using in-memory storage.
@@ -63,12 +64,14 @@ class AsyncMemoryCacheBackend(AsyncKeyValueCacheBackend):
             params: Dictionary of cache parameters from settings
             **options: Additional Django cache options
         """
-        if AsyncMemoryStore is None:
+        try:
+            store_cls = _resolve_store()
+        except ImportError as exc:
             raise ImportError(
                 "AsyncMemoryStore is not available. Install py-key-value-aio: "
                 "pip install py-key-value-aio[memory]"
-            )
-        store = AsyncMemoryStore()
+            ) from exc
+        store = store_cls()
         collection = options.pop("collection", None)
         if collection is None and params:
             collection = params.get("COLLECTION", "django_cache")
@@ -2,9 +2,17 @@
 Base backend class for Django cache integration with py-key-value stores.
 """
 
+import base64
+import logging
 import pickle
 import json
-from typing import Any, Optional, Dict, List, TYPE_CHECKING
+from datetime import datetime, timezone
+from typing import Any, Optional, Dict, Iterable, List, TYPE_CHECKING
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - optional dependency
+    ormsgpack = None  # type: ignore
 
 try:
     from key_value.sync.protocols.key_value import KeyValue
@@ -40,6 +48,18 @@ except ImportError:
             ) -> None: ...
             def delete_many(self, keys: List[str], collection: Optional[str] = None) -> int: ...
 
+            # Optional: atomic conditional write, returns True if the value was stored
+            def put_if_absent(
+                self,
+                key: str,
+                value: Dict[str, Any],
+                collection: Optional[str] = None,
+                ttl: Optional[float] = None,
+            ) -> bool: ...
+
+            # Optional: stores that can persist raw bytes (rather than JSON) set this
+            accepts_bytes: bool
+
     else:
         KeyValue = Any  # type: ignore
 
@@ -47,8 +67,117 @@ from django.core.cache.backends.base import BaseCache
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
 from django.utils.encoding import force_str
 
+from django_kv import observability
 from django_kv.observability import cache_span, record_cache_metrics
 
+logger = logging.getLogger(__name__)
+
+# Exact types the store's JSON encoding round-trips unchanged
+_JSON_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+# Containers that are JSON-safe only if their contents are, so they still need a probe
+_JSON_CONTAINER_TYPES = frozenset((dict, list))
+# Types packed with msgpack when ormsgpack is installed (no JSON probe)
+_MSGPACK_TYPES = frozenset((dict, list, bytes))
+
+# Types ormsgpack would otherwise coerce lossily (datetime -> str, tuple -> list,
+# str subclasses -> str, ...) are passed through so they fall back to pickle.
+_MSGPACK_OPTIONS = (
+    ormsgpack.OPT_PASSTHROUGH_BIG_INT
+    | ormsgpack.OPT_PASSTHROUGH_DATACLASS
+    | ormsgpack.OPT_PASSTHROUGH_DATETIME
+    | ormsgpack.OPT_PASSTHROUGH_ENUM
+    | ormsgpack.OPT_PASSTHROUGH_SUBCLASS
+    | ormsgpack.OPT_PASSTHROUGH_TUPLE
+    | ormsgpack.OPT_PASSTHROUGH_UUID
+    if ormsgpack is not None
+    else 0
+)
+
+# ormsgpack packs these as plain bytes, so they would come back as a different type
+_MSGPACK_LOSSY_TYPES = (bytearray, memoryview)
+# msgpack bin 8/16/32 markers; a payload without any of them holds no binary values
+_MSGPACK_BIN_MARKERS = (b"\xc4", b"\xc5", b"\xc6")
+
+
+def _msgpack_coerced(value: Any, payload: bytes) -> bool:
+    """
+    Return True if packing ``value`` turned a bytearray or memoryview into bytes.
+
+    Only payloads containing a msgpack bin marker can hold one, so the Python-level
+    walk over ``value`` is skipped for the common case.
+    """
+    if not any(marker in payload for marker in _MSGPACK_BIN_MARKERS):
+        return False
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type is dict:
+            stack.extend(item.values())
+        elif item_type in (list, tuple, set, frozenset):
+            stack.extend(item)
+        elif isinstance(item, _MSGPACK_LOSSY_TYPES):
+            return True
+    return False
+
+
+# Value encodings selectable with a cache's SERIALIZER option
+_SERIALIZERS = frozenset(("auto", "pickle", "msgpack"))
+
+# msgpack extension codes used by SERIALIZER "msgpack" for types msgpack lacks
+_EXT_TUPLE = 1
+_EXT_SET = 2
+_EXT_FROZENSET = 3
+_EXT_DATETIME = 4
+# Types packed with SERIALIZER "msgpack", including those carried as extension types
+_MSGPACK_EXT_TYPES = _MSGPACK_TYPES | frozenset((tuple, set, frozenset, datetime))
+
+
+def _msgpack_default(value: Any) -> Any:
+    """Encode tuples, sets and datetimes as msgpack extension types; reject the rest."""
+    value_type = type(value)
+    if value_type is datetime:
+        # An ISO string keeps only the UTC offset, so zone-aware values (e.g. ZoneInfo,
+        # whose offset depends on DST) are left to pickle
+        if value.tzinfo is None or value.tzinfo is timezone.utc:
+            return ormsgpack.Ext(_EXT_DATETIME, value.isoformat().encode("ascii"))
+        raise TypeError(f"Type is not msgpack serializable: {value.tzinfo!r} datetime")
+    if value_type is tuple:
+        code = _EXT_TUPLE
+    elif value_type is set:
+        code = _EXT_SET
+    elif value_type is frozenset:
+        code = _EXT_FROZENSET
+    else:
+        # Anything else falls back to pickle
+        raise TypeError(f"Type is not msgpack serializable: {value_type.__name__}")
+    return ormsgpack.Ext(
+        code, ormsgpack.packb(list(value), default=_msgpack_default, option=_MSGPACK_OPTIONS)
+    )
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == _EXT_DATETIME:
+        return datetime.fromisoformat(data.decode("ascii"))
+    items = ormsgpack.unpackb(data, ext_hook=_msgpack_ext_hook)
+    if code == _EXT_TUPLE:
+        return tuple(items)
+    if code == _EXT_SET:
+        return set(items)
+    if code == _EXT_FROZENSET:
+        return frozenset(items)
+    raise ValueError(f"Unknown msgpack extension type: {code}")
+
+
+def _decode_pickle(data: Any) -> Any:
+    if isinstance(data, bytes):
+        return pickle.loads(data)
+    # Pickles (protocol >= 2) start with b"\x80": "80..." when hex-encoded by older
+    # releases, "g..." when base64-encoded.
+    if data.startswith("80"):
+        return pickle.loads(bytes.fromhex(data))
+    return pickle.loads(base64.b64decode(data))
+
 
 class KeyValueCacheBackend(BaseCache):
     """
@@ -96,11 +225,42 @@ class KeyValueCacheBackend(BaseCache):
 
         super().__init__(params)
 
+        self._configure_serializer(params.get("SERIALIZER", "auto"))
+
         # Apply wrappers to the key_value store
         self.key_value = self._apply_wrappers(key_value, wrappers)
         self.collection = collection
         self.backend_name = self.__class__.__name__
         self._validate_backend()
+        # Resolve DJANGO_KV_OTEL now so observability.TRACING_ENABLED is current
+        observability._load_config()
+
+    @property
+    def key_value(self) -> KeyValue:
+        return self._key_value
+
+    @key_value.setter
+    def key_value(self, store: KeyValue) -> None:
+        # Bind the store methods and capabilities once per assignment (callers such as
+        # the encrypted session store re-wrap key_value after init), saving a lookup per
+        # operation.
+        self._key_value = store
+        self._has_put_if_absent = hasattr(store, "put_if_absent")
+        # Stores persisting JSON need pickles base64-encoded; stores advertising
+        # accepts_bytes get them raw
+        self._store_accepts_bytes = bool(getattr(store, "accepts_bytes", False))
+        self._kv_get = store.get
+        self._kv_put = store.put
+        self._kv_delete = store.delete
+        get_many = getattr(store, "get_many", None)
+        if get_many is None:
+
+            def get_many(keys: List[str], collection: Optional[str] = None) -> List[Any]:
+                return [store.get(key=key, collection=collection) for key in keys]
+
+        self._kv_get_many = get_many
+        self._kv_put_many = getattr(store, "put_many", None)
+        self._kv_delete_many = getattr(store, "delete_many", None)
 
     def _apply_wrappers(self, store: KeyValue, wrappers: Optional[list]) -> KeyValue:
         """
@@ -128,13 +288,45 @@ class KeyValueCacheBackend(BaseCache):
                 key = wrapper_config.get("key")
                 store = wrap_sync_with_fernet(store, key=key)
             elif wrapper_type == "compression":
-                # Future: add compression wrapper support
-                pass
+                # Compression is implemented by the async backends only
+                logger.warning(
+                    "The 'compression' wrapper is not supported by %s and is ignored",
+                    self.__class__.__name__,
+                )
             else:
                 raise ValueError(f"Unknown wrapper type: {wrapper_type}")
 
         return store
 
+    def _configure_serializer(self, serializer: str) -> None:
+        """
+        Select how container and object values are encoded.
+
+        Args:
+            serializer: One of
+                'auto' - msgpack for dicts, lists and bytes when ormsgpack is installed,
+                    otherwise JSON; pickle for everything else (default)
+                'pickle' - JSON for JSON-safe values, pickle for everything else
+                'msgpack' - msgpack for containers, bytes, tuples, sets and datetimes
+                    (requires ormsgpack); pickle for everything else
+        """
+        if serializer not in _SERIALIZERS:
+            raise ValueError(
+                f"Unknown serializer: {serializer!r}. Supported: 'auto', 'pickle', 'msgpack'"
+            )
+        self._msgpack_default = None
+        if serializer == "msgpack":
+            if ormsgpack is None:
+                raise ImportError(
+                    "The msgpack serializer requires ormsgpack: pip install django-kv[msgpack]"
+                )
+            self._msgpack_types = _MSGPACK_EXT_TYPES
+            self._msgpack_default = _msgpack_default
+        elif serializer == "auto" and ormsgpack is not None:
+            self._msgpack_types = _MSGPACK_TYPES
+        else:
+            self._msgpack_types = frozenset()
+
     def _validate_backend(self):
         """Validate that the backend implements required methods."""
         required_methods = ["get", "put", "delete"]
@@ -142,6 +334,17 @@ class KeyValueCacheBackend(BaseCache):
             if not hasattr(self.key_value, method):
                 raise AttributeError(f"KeyValue store must implement {method} method")
 
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @version.setter
+    def version(self, value: int) -> None:
+        # BaseCache assigns version in __init__; rebuild the default key prefix here so
+        # key construction never formats the version per call.
+        self._version = value
+        self._default_key_prefix_str = f"{self.key_prefix}:{value}:"
+
     def _make_key(self, key: str, version: Optional[int] = None) -> str:
         """
         Construct the cache key with versioning.
@@ -153,16 +356,43 @@ class KeyValueCacheBackend(BaseCache):
         Returns:
             Versioned cache key string
         """
-        key = force_str(key)
+        if type(key) is not str:
+            key = force_str(key)
+        if version is None:
+            return self._default_key_prefix_str + key
+        return self.key_prefix + ":" + str(version) + ":" + key
+
+    def _make_keys(self, keys: Iterable[Any], version: Optional[int] = None) -> List[str]:
+        """
+        Construct versioned cache keys for a batch.
+
+        The prefix is resolved once and str keys are concatenated in C via map();
+        batches containing non-str keys fall back to force_str per key.
+        """
         if version is None:
-            version = self.version
-        return f"{self.key_prefix}:{version}:{key}"
+            prefix = self._default_key_prefix_str
+        else:
+            prefix = self.key_prefix + ":" + str(version) + ":"
+        try:
+            return list(map(prefix.__add__, keys))
+        except TypeError:
+            return [prefix + force_str(key) for key in keys]
+
+    def _ttl(self, timeout: Any) -> Optional[float]:
+        """Resolve a Django timeout (or DEFAULT_TIMEOUT) to a TTL in seconds; None = no expiry."""
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        return float(timeout) if timeout is not None else None
 
     def _serialize(self, value: Any) -> Dict[str, Any]:
         """
         Serialize a value for storage.
 
-        Uses pickle for complex objects, JSON for simple types.
+        Uses JSON for simple types and pickle for everything else, dispatching on the
+        exact type so complex objects skip the JSON probe. With ormsgpack installed,
+        dicts, lists and bytes are binary-packed with msgpack instead of probed with
+        JSON (see ``_configure_serializer`` for the SERIALIZER option). Binary payloads
+        are base64-encoded unless the store accepts raw bytes.
 
         Args:
             value: The value to serialize
@@ -170,13 +400,34 @@ class KeyValueCacheBackend(BaseCache):
         Returns:
             Dictionary with serialized data
         """
-        try:
-            # Try JSON first for simple types
-            json.dumps(value)
+        value_type = type(value)
+        if value_type in _JSON_SCALAR_TYPES:
             return {"type": "json", "data": value}
-        except (TypeError, ValueError):
-            # Fall back to pickle for complex objects
-            return {"type": "pickle", "data": pickle.dumps(value).hex()}
+        payload = None
+        if value_type in self._msgpack_types:
+            try:
+                payload = ormsgpack.packb(
+                    value, default=self._msgpack_default, option=_MSGPACK_OPTIONS
+                )
+                data_type = "msgpack"
+            except ormsgpack.MsgpackEncodeError:
+                pass
+            else:
+                if _msgpack_coerced(value, payload):
+                    payload = None
+        elif not self._msgpack_types and value_type in _JSON_CONTAINER_TYPES:
+            try:
+                json.dumps(value)
+                return {"type": "json", "data": value}
+            except (TypeError, ValueError):
+                pass
+        if payload is None:
+            # Pickle complex objects (and subclasses/tuples JSON would coerce)
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            data_type = "pickle"
+        if not self._store_accepts_bytes:
+            payload = base64.b64encode(payload).decode("ascii")
+        return {"type": data_type, "data": payload}
 
     def _deserialize(self, stored: Dict[str, Any]) -> Any:
         """
@@ -191,13 +442,24 @@ class KeyValueCacheBackend(BaseCache):
         if not stored:
             return None
 
-        data_type = stored.get("type")
-        data = stored.get("data")
-
+        try:
+            data_type = stored["type"]
+        except KeyError:
+            # Fallback for raw dicts (backwards compatibility)
+            return stored
         if data_type == "json":
-            return data
-        elif data_type == "pickle":
-            return pickle.loads(bytes.fromhex(data))
+            return stored["data"]
+
+        data = stored.get("data")
+        if data_type == "pickle":
+            return _decode_pickle(data)
+        elif data_type == "msgpack":
+            if ormsgpack is None:
+                raise ImportError("ormsgpack is required to read msgpack-encoded cache values")
+            return ormsgpack.unpackb(
+                data if isinstance(data, bytes) else base64.b64decode(data),
+                ext_hook=_msgpack_ext_hook,
+            )
         else:
             # Fallback for raw dicts (backwards compatibility)
             return stored
@@ -215,17 +477,23 @@ class KeyValueCacheBackend(BaseCache):
             Cached value or default
         """
         cache_key = self._make_key(key, version)
+        if not observability.TRACING_ENABLED:
+            try:
+                result = self._kv_get(key=cache_key, collection=self.collection)
+            except Exception:
+                return default
+            return default if result is None else self._deserialize(result)
         with cache_span(
             "get", self.backend_name, self.collection, {"django_kv.cache.key": cache_key}
         ) as span:
             try:
-                result = self.key_value.get(key=cache_key, collection=self.collection)
+                result = self._kv_get(key=cache_key, collection=self.collection)
             except Exception:
                 record_cache_metrics("get", self.backend_name, error=True)
                 return default
-        hit = result is not None
-        if span:
-            span.set_attribute("django_kv.cache.hit", hit)
+            hit = result is not None
+            if span:
+                span.set_attribute("django_kv.cache.hit", hit)
         record_cache_metrics("get", self.backend_name, hit=hit)
         if result is None:
             return default
@@ -251,19 +519,23 @@ class KeyValueCacheBackend(BaseCache):
         serialized = self._serialize(value)
 
         # Convert timeout to float for py-key-value (None = no TTL)
-        ttl = float(timeout) if timeout is not None else None
+        ttl = self._ttl(timeout)
+        if not observability.TRACING_ENABLED:
+            try:
+                self._kv_put(key=cache_key, value=serialized, collection=self.collection, ttl=ttl)
+            except Exception:
+                pass
+            return
         with cache_span(
             "set", self.backend_name, self.collection, {"django_kv.cache.key": cache_key}
         ) as span:
             try:
-                self.key_value.put(
-                    key=cache_key, value=serialized, collection=self.collection, ttl=ttl
-                )
+                self._kv_put(key=cache_key, value=serialized, collection=self.collection, ttl=ttl)
             except Exception:
                 record_cache_metrics("set", self.backend_name, error=True)
                 return
-        if span:
-            span.set_attribute("django_kv.cache.ttl", ttl if ttl is not None else -1)
+            if span:
+                span.set_attribute("django_kv.cache.ttl", ttl if ttl is not None else -1)
         record_cache_metrics("set", self.backend_name)
 
     def delete(self, key: str, version: Optional[int] = None) -> bool:
@@ -278,16 +550,21 @@ class KeyValueCacheBackend(BaseCache):
             True if key was deleted, False otherwise
         """
         cache_key = self._make_key(key, version)
+        if not observability.TRACING_ENABLED:
+            try:
+                return self._kv_delete(key=cache_key, collection=self.collection)
+            except Exception:
+                return False
         with cache_span(
             "delete", self.backend_name, self.collection, {"django_kv.cache.key": cache_key}
         ) as span:
             try:
-                result = self.key_value.delete(key=cache_key, collection=self.collection)
+                result = self._kv_delete(key=cache_key, collection=self.collection)
             except Exception:
                 record_cache_metrics("delete", self.backend_name, error=True)
                 return False
-        if span:
-            span.set_attribute("django_kv.cache.deleted", result)
+            if span:
+                span.set_attribute("django_kv.cache.deleted", result)
         record_cache_metrics("delete", self.backend_name, hit=result)
         return result
 
@@ -310,13 +587,53 @@ class KeyValueCacheBackend(BaseCache):
         Returns:
             True if key was added, False if it already existed
         """
-        # Check if key exists via instrumented get
-        existing = self.get(key, version=version, default=None)
-        if existing is not None:
-            return False
+        cache_key = self._make_key(key, version)
+        serialized = self._serialize(value)
+        ttl = self._ttl(timeout)
+        if not observability.TRACING_ENABLED:
+            try:
+                return self._put_if_absent(cache_key, serialized, ttl)
+            except Exception:
+                return False
+        with cache_span(
+            "add", self.backend_name, self.collection, {"django_kv.cache.key": cache_key}
+        ) as span:
+            try:
+                added = self._put_if_absent(cache_key, serialized, ttl)
+            except Exception:
+                record_cache_metrics("add", self.backend_name, error=True)
+                return False
+            if span:
+                span.set_attribute("django_kv.cache.added", added)
+        record_cache_metrics("add", self.backend_name)
+        return added
+
+    def _put_if_absent(
+        self, cache_key: str, serialized: Dict[str, Any], ttl: Optional[float]
+    ) -> bool:
+        """
+        Store a serialized value unless the key exists.
+
+        Uses the store's ``put_if_absent`` when available. Otherwise checks with a
+        raw store get (no deserialization) followed by a put, which is not atomic: a
+        concurrent writer may set the key between the two calls. Subclasses override
+        this with a native conditional write.
+
+        A non-positive ttl stores nothing and, like Django's RedisCache, reports
+        whether the key was absent.
 
-        # Key doesn't exist, set it
-        self.set(key, value, timeout, version)
+        Returns:
+            True if the value was stored, False if the key already existed
+        """
+        if ttl is not None and ttl <= 0:
+            return self._kv_get(key=cache_key, collection=self.collection) is None
+        if self._has_put_if_absent:
+            return self.key_value.put_if_absent(
+                key=cache_key, value=serialized, collection=self.collection, ttl=ttl
+            )
+        if self._kv_get(key=cache_key, collection=self.collection) is not None:
+            return False
+        self._kv_put(key=cache_key, value=serialized, collection=self.collection, ttl=ttl)
         return True
 
     def get_many(self, keys: List[str], version: Optional[int] = None) -> Dict[str, Any]:
@@ -333,28 +650,30 @@ class KeyValueCacheBackend(BaseCache):
         if not keys:
             return {}
 
-        cache_keys = [self._make_key(key, version) for key in keys]
+        cache_keys = self._make_keys(keys, version)
+        if not observability.TRACING_ENABLED:
+            try:
+                results = self._kv_get_many(keys=cache_keys, collection=self.collection)
+            except Exception:
+                return {}
+            deser = self._deserialize
+            return {key: deser(raw) for key, raw in zip(keys, results) if raw is not None}
         with cache_span(
             "get_many", self.backend_name, self.collection, {"django_kv.cache.key_count": len(keys)}
         ) as span:
             try:
                 # py-key-value get_many returns list[dict[str, Any] | None]
-                results = self.key_value.get_many(keys=cache_keys, collection=self.collection)
+                results = self._kv_get_many(keys=cache_keys, collection=self.collection)
             except Exception:
                 record_cache_metrics("get_many", self.backend_name, error=True)
                 return {}
-        output = {}
-        hit_count = 0
-        miss_count = 0
-        for i, key in enumerate(keys):
-            if i < len(results) and results[i] is not None:
-                output[key] = self._deserialize(results[i])
-                hit_count += 1
-            else:
-                miss_count += 1
-        if span:
-            span.set_attribute("django_kv.cache.hit_count", hit_count)
-            span.set_attribute("django_kv.cache.miss_count", miss_count)
+            deser = self._deserialize
+            output = {key: deser(raw) for key, raw in zip(keys, results) if raw is not None}
+            hit_count = len(output)
+            miss_count = len(keys) - hit_count
+            if span:
+                span.set_attribute("django_kv.cache.hit_count", hit_count)
+                span.set_attribute("django_kv.cache.miss_count", miss_count)
         record_cache_metrics(
             "get_many", self.backend_name, hit_count=hit_count, miss_count=miss_count
         )
@@ -377,26 +696,31 @@ class KeyValueCacheBackend(BaseCache):
         if not data:
             return
 
-        cache_keys = []
-        serialized_values = []
-
-        for key, value in data.items():
-            cache_keys.append(self._make_key(key, version))
-            serialized_values.append(self._serialize(value))
+        cache_keys = self._make_keys(data, version)
+        ser = self._serialize
+        serialized_values = [ser(value) for value in data.values()]
 
-        ttl = float(timeout) if timeout is not None else None
+        ttl = self._ttl(timeout)
+        if not observability.TRACING_ENABLED:
+            try:
+                self._kv_put_many(
+                    keys=cache_keys, values=serialized_values, collection=self.collection, ttl=ttl
+                )
+            except Exception:
+                pass
+            return
         with cache_span(
             "set_many", self.backend_name, self.collection, {"django_kv.cache.key_count": len(data)}
         ) as span:
             try:
-                self.key_value.put_many(
+                self._kv_put_many(
                     keys=cache_keys, values=serialized_values, collection=self.collection, ttl=ttl
                 )
             except Exception:
                 record_cache_metrics("set_many", self.backend_name, error=True)
                 return
-        if span:
-            span.set_attribute("django_kv.cache.ttl", ttl if ttl is not None else -1)
+            if span:
+                span.set_attribute("django_kv.cache.ttl", ttl if ttl is not None else -1)
         record_cache_metrics("set_many", self.backend_name)
 
     def delete_many(self, keys: List[str], version: Optional[int] = None) -> None:
@@ -410,7 +734,13 @@ class KeyValueCacheBackend(BaseCache):
         if not keys:
             return
 
-        cache_keys = [self._make_key(key, version) for key in keys]
+        cache_keys = self._make_keys(keys, version)
+        if not observability.TRACING_ENABLED:
+            try:
+                self._kv_delete_many(keys=cache_keys, collection=self.collection)
+            except Exception:
+                pass
+            return
         with cache_span(
             "delete_many",
             self.backend_name,
@@ -418,12 +748,12 @@ class KeyValueCacheBackend(BaseCache):
             {"django_kv.cache.key_count": len(keys)},
         ) as span:
             try:
-                deleted = self.key_value.delete_many(keys=cache_keys, collection=self.collection)
+                deleted = self._kv_delete_many(keys=cache_keys, collection=self.collection)
             except Exception:
                 record_cache_metrics("delete_many", self.backend_name, error=True)
                 return
-        if span:
-            span.set_attribute("django_kv.cache.deleted_count", deleted)
+            if span:
+                span.set_attribute("django_kv.cache.deleted_count", deleted)
         record_cache_metrics("delete_many", self.backend_name, hit_count=deleted)
 
     def clear(self) -> None:
@@ -450,16 +780,21 @@ class KeyValueCacheBackend(BaseCache):
             True if key exists, False otherwise
         """
         cache_key = self._make_key(key, version)
+        if not observability.TRACING_ENABLED:
+            try:
+                return self._kv_get(key=cache_key, collection=self.collection) is not None
+            except Exception:
+                return False
         with cache_span(
             "has_key", self.backend_name, self.collection, {"django_kv.cache.key": cache_key}
         ) as span:
             try:
-                result = self.key_value.get(key=cache_key, collection=self.collection)
+                result = self._kv_get(key=cache_key, collection=self.collection)
             except Exception:
                 record_cache_metrics("has_key", self.backend_name, error=True)
                 return False
-        hit = result is not None
-        if span:
-            span.set_attribute("django_kv.cache.hit", hit)
+            hit = result is not None
+            if span:
+                span.set_attribute("django_kv.cache.hit", hit)
         record_cache_metrics("has_key", self.backend_name, hit=hit)
         return hit
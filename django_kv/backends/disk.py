@@ -21,9 +21,10 @@ def _load_disk_store():
             repo_root / "external" / "py-key-value" / "key-value" / "key-value-sync" / "src",
             repo_root / "external" / "py-key-value" / "key-value" / "key-value-shared" / "src",
         ]
+        on_path = set(sys.path)
         added = False
         for path in candidate_paths:
-            if path.exists() and str(path) not in sys.path:
+            if str(path) not in on_path and path.exists():
                 sys.path.insert(0, str(path))
                 added = True
         if added:
@@ -6,12 +6,18 @@ Perfect for development and CI environments.
 
 from django_kv.backends.base import KeyValueCacheBackend
 
+from functools import lru_cache
 from pathlib import Path
 import sys
 
 
-def _load_memory_store():
-    """Load MemoryStore from py-key-value, adding vendored paths if needed."""
+@lru_cache(maxsize=1)
+def _resolve_store():
+    """
+    Load MemoryStore from py-key-value, adding vendored paths if needed.
+
+    Resolved on first backend instantiation rather than at import, and memoized.
+    """
     try:
         from key_value.sync.stores.memory import MemoryStore as _MemoryStore  # type: ignore
 
@@ -22,9 +28,10 @@ def _load_memory_store():
             repo_root / "external" / "py-key-value" / "key-value" / "key-value-sync" / "src",
             repo_root / "external" / "py-key-value" / "key-value" / "key-value-shared" / "src",
         ]
+        on_path = set(sys.path)
         added = False
         for path in candidate_paths:
-            if path.exists() and str(path) not in sys.path:
+            if str(path) not in on_path and path.exists():
                 sys.path.insert(0, str(path))
                 added = True
         if added:
@@ -34,12 +41,6 @@ def _load_memory_store():
         raise
 
 
-try:
-    MemoryStore = _load_memory_store()
-except ImportError:
-    MemoryStore = None  # type: ignore
-
-
 class MemoryCacheBackend(KeyValueCacheBackend):
     """
     Django cache backend using in-memory storage.
@@ -65,11 +66,13 @@ class MemoryCacheBackend(KeyValueCacheBackend):
             params: Dictionary of cache parameters from settings
             **options: Additional Django cache options
         """
-        if MemoryStore is None:
+        try:
+            store_cls = _resolve_store()
+        except ImportError as exc:
             raise ImportError(
                 "MemoryStore is not available. Install py-key-value: " "pip install py-key-value"
-            )
-        store = MemoryStore()
+            ) from exc
+        store = store_cls()
         # Extract collection from params or options
         collection = options.pop("collection", None)
         if collection is None and params:
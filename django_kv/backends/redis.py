@@ -4,7 +4,8 @@ Redis cache backend using py-key-value RedisStore.
 Ideal for staging and production environments requiring distributed caching.
 """
 
-from typing import Optional
+import logging
+from typing import Any, Dict, Optional
 from django_kv.backends.base import KeyValueCacheBackend
 
 try:
@@ -12,6 +13,15 @@ try:
 except ImportError:
     RedisStore = None
 
+try:
+    from key_value.shared.utils.compound import compound_key
+    from key_value.shared.utils.managed_entry import ManagedEntry
+    from key_value.shared.utils.time_to_live import prepare_entry_timestamps
+except ImportError:
+    compound_key = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
 
 class RedisCacheBackend(KeyValueCacheBackend):
     """
@@ -20,6 +30,9 @@ class RedisCacheBackend(KeyValueCacheBackend):
     This backend uses py-key-value's RedisStore, providing distributed
     caching suitable for staging and production environments.
 
+    Bulk operations cost one round-trip per batch: RedisStore serves get_many with
+    MGET and put_many with MSET (or a single pipeline of SETEX when a timeout is set).
+
     Configuration example:
         CACHES = {
             'default': {
@@ -69,3 +82,43 @@ class RedisCacheBackend(KeyValueCacheBackend):
 
         store = RedisStore(**redis_kwargs)
         super().__init__(key_value=store, collection=collection, **options)
+
+    def _put_if_absent(
+        self, cache_key: str, serialized: Dict[str, Any], ttl: Optional[float]
+    ) -> bool:
+        """
+        Store a serialized value with a single ``SET ... NX``.
+
+        RedisStore has no public conditional write, so the entry is built the way
+        RedisStore.put builds it. Falls back to the generic path when the store is
+        wrapped (e.g. encryption) and the client isn't reachable, or when the store
+        internals don't match what this method expects (logged, since add() reports
+        errors as "not added").
+        """
+        store: Any = self.key_value
+        client = getattr(store, "_client", None)
+        adapter = getattr(store, "_adapter", None)
+        # A non-positive timeout stores nothing; the generic path reports absence
+        if (
+            compound_key is None
+            or client is None
+            or adapter is None
+            or (ttl is not None and ttl <= 0)
+        ):
+            return super()._put_if_absent(cache_key, serialized, ttl)
+
+        try:
+            store.setup_collection(collection=self.collection)
+            created_at, _, expires_at = prepare_entry_timestamps(ttl=ttl)
+            entry = ManagedEntry(value=serialized, created_at=created_at, expires_at=expires_at)
+            json_value = adapter.dump_json(entry=entry, key=cache_key, collection=self.collection)
+            name = compound_key(collection=self.collection, key=cache_key)
+        except (AttributeError, TypeError, ValueError):
+            logger.warning(
+                "RedisStore internals changed; add() is using the non-atomic fallback",
+                exc_info=True,
+            )
+            return super()._put_if_absent(cache_key, serialized, ttl)
+        # Redis does not support sub-second TTLs with EX
+        ex = max(int(ttl), 1) if ttl is not None else None
+        return bool(client.set(name=name, value=json_value, ex=ex, nx=True))
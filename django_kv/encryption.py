@@ -7,10 +7,13 @@ from __future__ import annotations
 import base64
 import hashlib
 import logging
+from functools import lru_cache
 from typing import Any, Optional
 
 from django.conf import settings  # type: ignore
 from django.core.exceptions import ImproperlyConfigured  # type: ignore
+from django.core.signals import setting_changed  # type: ignore
+from django.dispatch import receiver  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +37,18 @@ except ImportError:  # pragma: no cover
     SyncFernetWrapper = None  # type: ignore
 
 
+# Fernet key resolved from settings; memoized per process, cleared when settings change
+_settings_key: Optional[bytes] = None
+
+
+@receiver(setting_changed)
+def _reset_settings_key(*, setting: str, **kwargs: Any) -> None:
+    global _settings_key
+    if setting in ("SECRET_KEY", "DJANGO_KV_ENCRYPTION_KEY"):
+        _settings_key = None
+
+
+@lru_cache(maxsize=4)
 def _derive_fernet_key_from_secret_key(secret_key: str) -> bytes:
     """
     Derive a Fernet-compatible key (32 bytes, URL-safe base64) from Django's SECRET_KEY.
@@ -63,27 +78,39 @@ def _get_fernet_key(key: Optional[str | bytes] = None) -> bytes:
 
     # Explicit key provided
     if key:
+        return _coerce_fernet_key(key)
+
+    global _settings_key
+    if _settings_key is None:
+        _settings_key = _get_settings_fernet_key()
+    return _settings_key
+
+
+def _coerce_fernet_key(key: str | bytes) -> bytes:
+    """
+    Return ``key`` as a Fernet key (URL-safe base64 of 32 bytes).
+
+    Strings that are not valid Fernet keys are treated as secrets to derive a key from;
+    raw 32-byte keys are base64-encoded.
+    """
+    encoded = key.encode("utf-8") if isinstance(key, str) else key
+    try:
+        Fernet(encoded)
+    except ValueError:
         if isinstance(key, str):
-            # If it's a string, try to decode it as base64, otherwise derive from it
-            try:
-                return base64.urlsafe_b64decode(key.encode("utf-8"))
-            except Exception:
-                # If it's not valid base64, derive from it
-                return _derive_fernet_key_from_secret_key(key)
-        return key
+            return _derive_fernet_key_from_secret_key(key)
+        if len(key) == 32:
+            return base64.urlsafe_b64encode(key)
+        raise ImproperlyConfigured("Encryption key must be a Fernet key or 32 raw bytes")
+    return encoded
+
 
+def _get_settings_fernet_key() -> bytes:
+    """Resolve the Fernet key from DJANGO_KV_ENCRYPTION_KEY or SECRET_KEY."""
     # Check settings for explicit encryption key
     encryption_key = getattr(settings, "DJANGO_KV_ENCRYPTION_KEY", None)
     if encryption_key:
-        if isinstance(encryption_key, bytes):
-            return encryption_key
-        if isinstance(encryption_key, str):
-            try:
-                import base64
-
-                return base64.urlsafe_b64decode(encryption_key.encode("utf-8"))
-            except Exception:
-                return _derive_fernet_key_from_secret_key(encryption_key)
+        return _coerce_fernet_key(encryption_key)
 
     # Fall back to deriving from SECRET_KEY
     django_secret_key = getattr(settings, "SECRET_KEY", None)
@@ -114,7 +141,7 @@ def wrap_async_with_fernet(
     if AsyncFernetWrapper is None:
         raise ImportError("Async encryption requires py-key-value-aio[encryption]")
     fernet_key = _get_fernet_key(key)
-    return AsyncFernetWrapper(key_value=key_value, key=fernet_key)
+    return AsyncFernetWrapper(key_value=key_value, fernet=Fernet(fernet_key))
 
 
 def wrap_sync_with_fernet(key_value: KeyValue, key: Optional[str | bytes] = None) -> KeyValue:
@@ -132,4 +159,4 @@ def wrap_sync_with_fernet(key_value: KeyValue, key: Optional[str | bytes] = None
     if SyncFernetWrapper is None:
         raise ImportError("Sync encryption requires py-key-value-sync[encryption]")
     fernet_key = _get_fernet_key(key)
-    return SyncFernetWrapper(key_value=key_value, key=fernet_key)
+    return SyncFernetWrapper(key_value=key_value, fernet=Fernet(fernet_key))
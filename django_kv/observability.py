@@ -5,10 +5,16 @@ OpenTelemetry helpers for django-kv.
 from __future__ import annotations
 
 import logging
-from contextlib import contextmanager
-from typing import Any, Dict, Optional
+import sys
+import threading
+from contextlib import nullcontext
+from functools import partial
+from random import random
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
 
 from django.conf import settings  # type: ignore
+from django.core.signals import request_finished, request_started, setting_changed  # type: ignore
+from django.dispatch import receiver  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +35,36 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "INSTRUMENT_SESSIONS": True,
     "METRICS_ENABLED": True,
     "AUTO_INSTRUMENT_DJANGO": False,
+    "SESSION_SAMPLING_RATE": 1.0,
+    "FAST_PATH": False,
 }
 
-_config: Optional[Dict[str, Any]] = None
+
+class _Cfg(NamedTuple):
+    """DJANGO_KV_OTEL merged over DEFAULT_CONFIG, frozen until the setting changes."""
+
+    enabled: bool
+    instrument_cache: bool
+    instrument_sessions: bool
+    metrics_enabled: bool
+    auto_instrument_django: bool
+    session_sampling_rate: float
+    fast_path: bool
+
+
+_config: Optional[_Cfg] = None
+# True when DJANGO_KV_OTEL is enabled and OpenTelemetry is importable. Kept current by
+# _load_config()/reload_config() so hot paths can skip instrumentation with one check.
+TRACING_ENABLED = False
+# Per-feature switches derived from the config in _load_config(); plain module globals so
+# each hot-path check is a single global lookup.
+_CACHE_ON = False
+_SESSIONS_ON = False
+_METRICS_ON = False
+# Fraction of session operations that get a span; below 1.0 the rest skip span creation
+_SESSION_SAMPLING_RATE = 1.0
+# Set once the global tracer provider is found to be a NoOpTracerProvider
+_NOOP_PROVIDER = False
 _tracer = None
 _meter = None
 _missing_warning_logged = False
@@ -41,23 +74,67 @@ _miss_counter = None
 _error_counter = None
 _session_counter = None
 _django_instrumented = False
+# Counter ``add`` callables pre-bound to their attribute dicts, keyed by (backend, operation)
+# as (requests, hits, misses, errors) and by (operation, success) for sessions. The
+# cardinality is tiny, so each combination is bound once per set of counters.
+_CACHE_ADDERS: Dict[Tuple[str, str], Tuple[Callable[[int], None], ...]] = {}
+_SESSION_ADDERS: Dict[Tuple[str, bool], Callable[[], None]] = {}
+# Per-thread cache metric totals, {(backend, operation): [requests, hits, misses, errors]},
+# collected while a request is in flight and flushed to the counters when it finishes.
+_pending = threading.local()
 
+# Attribute names, interned once so every span/metric shares the same key objects
+_ATTR_CACHE_BACKEND = sys.intern("django_kv.cache.backend")
+_ATTR_CACHE_COLLECTION = sys.intern("django_kv.cache.collection")
+_ATTR_CACHE_OPERATION = sys.intern("django_kv.cache.operation")
+_ATTR_SESS_KEY = sys.intern("django_kv.session.key")
+_ATTR_SESS_OPERATION = sys.intern("django_kv.session.operation")
+_ATTR_SESS_SUCCESS = sys.intern("django_kv.session.success")
 
-def _load_config() -> Dict[str, Any]:
-    global _config
+# Interned span names by operation, e.g. "get" -> "django_kv.cache.get"
+_CACHE_SPAN_NAMES: Dict[str, str] = {}
+_SESSION_SPAN_NAMES: Dict[str, str] = {}
+
+# Shared no-op returned by cache_span/session_span when tracing is off (reusable, yields None)
+NULL_SPAN = nullcontext(None)
+
+
+def _load_config() -> _Cfg:
+    global _config, TRACING_ENABLED, _CACHE_ON, _SESSIONS_ON, _METRICS_ON, _SESSION_SAMPLING_RATE
+    global _missing_warning_logged
     if _config is not None:
         return _config
-    user_cfg = getattr(settings, "DJANGO_KV_OTEL", None) or {}
-    cfg = DEFAULT_CONFIG.copy()
-    cfg.update(user_cfg)
-    _config = cfg
-    return _config
+    merged = {**DEFAULT_CONFIG, **(getattr(settings, "DJANGO_KV_OTEL", None) or {})}
+    cfg = _config = _Cfg(
+        enabled=bool(merged["ENABLED"]),
+        instrument_cache=bool(merged["INSTRUMENT_CACHE"]),
+        instrument_sessions=bool(merged["INSTRUMENT_SESSIONS"]),
+        metrics_enabled=bool(merged["METRICS_ENABLED"]),
+        auto_instrument_django=bool(merged["AUTO_INSTRUMENT_DJANGO"]),
+        session_sampling_rate=float(merged["SESSION_SAMPLING_RATE"]),
+        fast_path=bool(merged["FAST_PATH"]),
+    )
+    if cfg.enabled and trace is None and metrics is None and not _missing_warning_logged:
+        logger.warning("DJANGO_KV_OTEL is enabled but OpenTelemetry packages are not installed")
+        _missing_warning_logged = True
+    TRACING_ENABLED = cfg.enabled and (trace is not None or metrics is not None)
+    _CACHE_ON = cfg.enabled and cfg.instrument_cache and trace is not None
+    _SESSIONS_ON = (
+        cfg.enabled
+        and cfg.instrument_sessions
+        and cfg.session_sampling_rate > 0
+        and trace is not None
+    )
+    _SESSION_SAMPLING_RATE = cfg.session_sampling_rate
+    _METRICS_ON = cfg.enabled and cfg.metrics_enabled and metrics is not None
+    return cfg
 
 
 def reload_config() -> None:
-    global _config, _tracer, _meter, _request_counter, _hit_counter, _miss_counter, _error_counter, _session_counter, _missing_warning_logged, _django_instrumented
+    global _config, _tracer, _NOOP_PROVIDER, _meter, _request_counter, _hit_counter, _miss_counter, _error_counter, _session_counter, _missing_warning_logged, _django_instrumented
     _config = None
     _tracer = None
+    _NOOP_PROVIDER = False
     _meter = None
     _request_counter = None
     _hit_counter = None
@@ -66,27 +143,26 @@ def reload_config() -> None:
     _session_counter = None
     _missing_warning_logged = False
     _django_instrumented = False
+    _load_config()
 
 
-def _enabled(key: str) -> bool:
-    cfg = _load_config()
-    if not cfg.get("ENABLED"):
-        return False
-    global _missing_warning_logged
-    if trace is None and metrics is None:
-        if not _missing_warning_logged:
-            logger.warning("DJANGO_KV_OTEL is enabled but OpenTelemetry packages are not installed")
-            _missing_warning_logged = True
-        return False
-    return cfg.get(key, True)
+@receiver(setting_changed)
+def _reload_on_setting_changed(*, setting: str, **kwargs: Any) -> None:
+    if setting == "DJANGO_KV_OTEL":
+        reload_config()
 
 
 def _get_tracer():
-    global _tracer
-    if trace is None:
+    global _tracer, _NOOP_PROVIDER
+    if trace is None or _NOOP_PROVIDER:
         return None
     if _tracer is None:
-        _tracer = trace.get_tracer("django-kv")
+        provider = trace.get_tracer_provider()
+        if isinstance(provider, trace.NoOpTracerProvider):
+            # Spans would be discarded anyway; skip creating them at all
+            _NOOP_PROVIDER = True
+            return None
+        _tracer = provider.get_tracer("django-kv")
     return _tracer
 
 
@@ -99,39 +175,86 @@ def _get_meter():
     return _meter
 
 
-@contextmanager
+class _SpanContext:
+    """Context manager around ``tracer.start_as_current_span`` that flags errors."""
+
+    __slots__ = ("_cm", "span")
+
+    def __init__(self, tracer: Any, name: str, attributes: Optional[Dict[str, Any]]):
+        # Attributes go in at span start: one bulk set instead of a set_attribute per key
+        self._cm = tracer.start_as_current_span(name, attributes=attributes)
+        self.span = None
+
+    def __enter__(self):
+        span = self.span = self._cm.__enter__()
+        return span
+
+    def __exit__(self, exc_type, exc, tb):
+        if isinstance(exc, Exception):
+            span = self.span
+            if StatusCode:
+                span.set_status(StatusCode.ERROR)  # type: ignore[attr-defined]
+            span.record_exception(exc)
+        return self._cm.__exit__(exc_type, exc, tb)
+
+
 def cache_span(
     operation: str,
     backend: str,
     collection: Optional[str] = None,
     attributes: Optional[Dict[str, Any]] = None,
 ):
-    if not _enabled("INSTRUMENT_CACHE"):
-        yield None
-        return
+    if not _CACHE_ON:
+        return NULL_SPAN
     tracer = _get_tracer()
     if tracer is None:
-        yield None
-        return
-    name = f"django_kv.cache.{operation}"
-    base_attrs = {
-        "django_kv.cache.backend": backend,
-    }
+        return NULL_SPAN
+    attrs: Dict[str, Any] = {_ATTR_CACHE_BACKEND: backend}
     if collection:
-        base_attrs["django_kv.cache.collection"] = collection
-    with tracer.start_as_current_span(name) as span:
-        for key, value in base_attrs.items():
-            span.set_attribute(key, value)
-        if attributes:
-            for key, value in attributes.items():
-                span.set_attribute(key, value)
-        try:
-            yield span
-        except Exception as exc:  # pragma: no cover - handled via tests
-            if StatusCode:
-                span.set_status(StatusCode.ERROR)  # type: ignore[attr-defined]
-            span.record_exception(exc)
-            raise
+        attrs[_ATTR_CACHE_COLLECTION] = collection
+    if attributes:
+        attrs.update(attributes)
+    name = _CACHE_SPAN_NAMES.get(operation)
+    if name is None:
+        name = _CACHE_SPAN_NAMES[operation] = sys.intern(f"django_kv.cache.{operation}")
+    return _SpanContext(tracer, name, attrs)
+
+
+def _ensure_counters() -> bool:
+    """Create the cache and session counters on first use; False if there is no meter."""
+    global _request_counter, _hit_counter, _miss_counter, _error_counter, _session_counter
+    meter = _get_meter()
+    if meter is None:
+        return False
+    _request_counter = meter.create_counter(
+        "django_kv.cache.requests", description="Total cache operations"
+    )
+    _hit_counter = meter.create_counter("django_kv.cache.hits", description="Cache hits")
+    _miss_counter = meter.create_counter("django_kv.cache.misses", description="Cache misses")
+    _error_counter = meter.create_counter("django_kv.cache.errors", description="Cache errors")
+    _session_counter = meter.create_counter(
+        "django_kv.session.operations", description="Session backend operations"
+    )
+    _CACHE_ADDERS.clear()
+    _SESSION_ADDERS.clear()
+    return True
+
+
+def _bind_cache_adders(backend: str, operation: str) -> Tuple[Callable[[int], None], ...]:
+    attrs = {_ATTR_CACHE_BACKEND: backend, _ATTR_CACHE_OPERATION: operation}
+    adders = _CACHE_ADDERS[(backend, operation)] = tuple(
+        partial(counter.add, attributes=attrs)  # type: ignore[union-attr]
+        for counter in (_request_counter, _hit_counter, _miss_counter, _error_counter)
+    )
+    return adders
+
+
+def _bind_session_adder(operation: str, success: bool) -> Callable[[], None]:
+    attrs = {_ATTR_SESS_OPERATION: operation, _ATTR_SESS_SUCCESS: success}
+    adder = _SESSION_ADDERS[(operation, success)] = partial(
+        _session_counter.add, 1, attributes=attrs  # type: ignore[union-attr]
+    )
+    return adder
 
 
 def record_cache_metrics(
@@ -142,68 +265,83 @@ def record_cache_metrics(
     miss_count: Optional[int] = None,
     error: bool = False,
 ):
-    if not (_enabled("METRICS_ENABLED") and metrics is not None):
+    if not _METRICS_ON:
         return
-    meter = _get_meter()
-    if meter is None:
+    hits = hit_count if hit_count is not None else (1 if hit is True else 0)
+    misses = miss_count if miss_count is not None else (1 if hit is False else 0)
+    pending = getattr(_pending, "counts", None)
+    if pending is None:
+        _add_cache_metrics(backend, operation, 1, hits, misses, int(error))
         return
-    global _request_counter, _hit_counter, _miss_counter, _error_counter
-    if _request_counter is None:
-        _request_counter = meter.create_counter(
-            "django_kv.cache.requests", description="Total cache operations"
-        )
-        _hit_counter = meter.create_counter("django_kv.cache.hits", description="Cache hits")
-        _miss_counter = meter.create_counter("django_kv.cache.misses", description="Cache misses")
-        _error_counter = meter.create_counter("django_kv.cache.errors", description="Cache errors")
-    attrs = {"django_kv.cache.backend": backend, "django_kv.cache.operation": operation}
-    _request_counter.add(1, attributes=attrs)
-    if error:
-        _error_counter.add(1, attributes=attrs)
-    if hit is True:
-        _hit_counter.add(1, attributes=attrs)
-    elif hit is False:
-        _miss_counter.add(1, attributes=attrs)
-    if hit_count is not None and hit_count > 0:
-        _hit_counter.add(hit_count, attributes=attrs)
-    if miss_count is not None and miss_count > 0:
-        _miss_counter.add(miss_count, attributes=attrs)
-
-
-@contextmanager
-def session_span(operation: str, session_key: Optional[str] = None):
-    if not _enabled("INSTRUMENT_SESSIONS"):
-        yield None
+    totals = pending.get((backend, operation))
+    if totals is None:
+        totals = pending[(backend, operation)] = [0, 0, 0, 0]
+    totals[0] += 1
+    totals[1] += hits
+    totals[2] += misses
+    totals[3] += error
+
+
+def _add_cache_metrics(
+    backend: str, operation: str, requests: int, hits: int, misses: int, errors: int
+) -> None:
+    if _request_counter is None and not _ensure_counters():
         return
+    adders = _CACHE_ADDERS.get((backend, operation)) or _bind_cache_adders(backend, operation)
+    add_request, add_hit, add_miss, add_error = adders
+    add_request(requests)
+    if hits > 0:
+        add_hit(hits)
+    if misses > 0:
+        add_miss(misses)
+    if errors:
+        add_error(errors)
+
+
+def _flush_cache_metrics() -> None:
+    """Send this thread's batched cache metrics to the counters."""
+    counts = getattr(_pending, "counts", None)
+    if counts is None:
+        return
+    _pending.counts = None
+    for (backend, operation), totals in counts.items():
+        _add_cache_metrics(backend, operation, *totals)
+
+
+@receiver(request_started)
+def _start_metrics_batch(**kwargs: Any) -> None:
+    # Flush leftovers in case a previous request finished on another thread
+    _flush_cache_metrics()
+    if _METRICS_ON:
+        _pending.counts = {}
+
+
+@receiver(request_finished)
+def _finish_metrics_batch(**kwargs: Any) -> None:
+    _flush_cache_metrics()
+
+
+def session_span(operation: str, session_key: Optional[str] = None):
+    if not _SESSIONS_ON:
+        return NULL_SPAN
+    if _SESSION_SAMPLING_RATE < 1.0 and random() >= _SESSION_SAMPLING_RATE:
+        return NULL_SPAN
     tracer = _get_tracer()
     if tracer is None:
-        yield None
-        return
-    name = f"django_kv.session.{operation}"
-    with tracer.start_as_current_span(name) as span:
-        if session_key:
-            span.set_attribute("django_kv.session.key", session_key)
-        try:
-            yield span
-        except Exception as exc:  # pragma: no cover
-            if StatusCode:
-                span.set_status(StatusCode.ERROR)  # type: ignore[attr-defined]
-            span.record_exception(exc)
-            raise
+        return NULL_SPAN
+    attrs = {_ATTR_SESS_KEY: session_key} if session_key else None
+    name = _SESSION_SPAN_NAMES.get(operation)
+    if name is None:
+        name = _SESSION_SPAN_NAMES[operation] = sys.intern(f"django_kv.session.{operation}")
+    return _SpanContext(tracer, name, attrs)
 
 
 def record_session_metrics(operation: str, success: bool):
-    if not (_enabled("METRICS_ENABLED") and metrics is not None):
+    if not _METRICS_ON:
         return
-    meter = _get_meter()
-    if meter is None:
+    if _session_counter is None and not _ensure_counters():
         return
-    global _session_counter
-    if _session_counter is None:
-        _session_counter = meter.create_counter(
-            "django_kv.session.operations", description="Session backend operations"
-        )
-    attrs = {"django_kv.session.operation": operation, "django_kv.session.success": success}
-    _session_counter.add(1, attributes=attrs)
+    (_SESSION_ADDERS.get((operation, success)) or _bind_session_adder(operation, success))()
 
 
 def auto_instrument_django() -> bool:
@@ -211,7 +349,7 @@ def auto_instrument_django() -> bool:
     Automatically instrument Django via opentelemetry instrumentation if enabled.
     """
     cfg = _load_config()
-    if not (cfg.get("ENABLED") and cfg.get("AUTO_INSTRUMENT_DJANGO")):
+    if not (cfg.enabled and cfg.auto_instrument_django):
         return False
     if DjangoInstrumentor is None:  # pragma: no cover - requires extra package
         logger.warning(
@@ -224,3 +362,9 @@ def auto_instrument_django() -> bool:
     DjangoInstrumentor().instrument()
     _django_instrumented = True
     return True
+
+
+# Resolve the config on import so the span and metric helpers are live before any cache
+# backend is constructed; DjangoKvConfig.ready() covers imports made before settings exist.
+if settings.configured:
+    _load_config()
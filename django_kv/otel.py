@@ -4,39 +4,284 @@ Helper utilities to bootstrap OpenTelemetry providers for django-kv.
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+import logging
+import os
+import threading
+import weakref
+from collections import deque
+from itertools import cycle
+from typing import Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
 
 try:
+    from grpc import Compression
     from opentelemetry import trace
     from opentelemetry.sdk.resources import Resource
-    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
     from opentelemetry.sdk.trace.export import BatchSpanProcessor
     from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 except ImportError:  # pragma: no cover
     trace = None  # type: ignore
     TracerProvider = None  # type: ignore
+    SpanProcessor = object  # type: ignore
+
+
+class _RoundRobinSpanProcessor(SpanProcessor):  # type: ignore[misc,valid-type]
+    """
+    Hand each finished span to one of several processors in turn.
+
+    Adding several processors to a provider directly would export every span once per
+    processor; this spreads spans across them instead, so each exporter (and its gRPC
+    channel) carries a share of the traffic.
+    """
+
+    def __init__(self, processors: Sequence):
+        self._processors = tuple(processors)
+        self._next = cycle(self._processors).__next__
+
+    def on_start(self, span, parent_context=None) -> None:
+        for processor in self._processors:
+            processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span) -> None:
+        self._next().on_end(span)
+
+    def shutdown(self) -> None:
+        for processor in self._processors:
+            processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return all([processor.force_flush(timeout_millis) for processor in self._processors])
+
+
+class _RingBufferSpanProcessor(SpanProcessor):  # type: ignore[misc,valid-type]
+    """
+    Buffer finished spans in a bounded ring and export them from a background thread.
+
+    ``on_end`` only appends to a ``deque(maxlen=capacity)`` (atomic in CPython, no lock on
+    the request thread unless the ring is full); when the ring is full the oldest span is
+    overwritten and counted in ``dropped``. A daemon thread drains the ring to the exporter
+    in batches every ``schedule_delay_millis``.
+    """
+
+    def __init__(
+        self,
+        exporter,
+        capacity: int = 1 << 16,
+        schedule_delay_millis: int = 1000,
+        max_export_batch_size: int = 512,
+    ):
+        self._exporter = exporter
+        self._buffer: deque = deque(maxlen=capacity)
+        self._delay = schedule_delay_millis / 1000
+        self._batch_size = max_export_batch_size
+        self._export_lock = threading.Lock()
+        self._drop_lock = threading.Lock()
+        self._shutdown = threading.Event()
+        self._dropped = 0
+        self._start_drainer()
+        _ring_processors.add(self)
+
+    @property
+    def dropped(self) -> int:
+        """Spans overwritten because the ring was full."""
+        return self._dropped
+
+    def _start_drainer(self) -> None:
+        self._thread = threading.Thread(
+            target=self._drain_loop, name="django-kv-span-drain", daemon=True
+        )
+        self._thread.start()
+
+    def _after_fork(self) -> None:
+        # Locks and events may have been held or waited on by threads that no longer exist
+        shut_down = self._shutdown.is_set()
+        # Spans queued before the fork belong to the parent, which still exports them
+        self._buffer.clear()
+        self._dropped = 0
+        self._export_lock = threading.Lock()
+        self._drop_lock = threading.Lock()
+        self._shutdown = threading.Event()
+        if shut_down:
+            self._shutdown.set()
+        else:
+            self._start_drainer()
+
+    def on_start(self, span, parent_context=None) -> None:
+        pass
+
+    def on_end(self, span) -> None:
+        buffer = self._buffer
+        if len(buffer) == buffer.maxlen:
+            with self._drop_lock:
+                self._dropped += 1
+        buffer.append(span)
+
+    def _drain(self) -> None:
+        popleft = self._buffer.popleft
+        with self._export_lock:
+            while True:
+                batch = []
+                try:
+                    for _ in range(self._batch_size):
+                        batch.append(popleft())
+                except IndexError:
+                    pass
+                if not batch:
+                    return
+                try:
+                    self._exporter.export(batch)
+                except Exception:  # pragma: no cover - exporter failures are logged only
+                    logger.exception("Failed to export %d spans", len(batch))
+                if len(batch) < self._batch_size:
+                    return
+
+    def _drain_loop(self) -> None:
+        while not self._shutdown.wait(self._delay):
+            self._drain()
+        self._drain()
+
+    def shutdown(self) -> None:
+        self._shutdown.set()
+        self._thread.join()
+        self._exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        self._drain()
+        return True
+
+
+# Live ring processors; one fork hook restarts all of their drainers in the child
+_ring_processors: "weakref.WeakSet[_RingBufferSpanProcessor]" = weakref.WeakSet()
+
+
+def _after_fork() -> None:
+    # Threads do not survive fork(); restart the drainers in the child
+    for processor in list(_ring_processors):
+        processor._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+def _fast_path_configured() -> bool:
+    """Return ``DJANGO_KV_OTEL["FAST_PATH"]``, or False when settings are unavailable."""
+    from django.core.exceptions import ImproperlyConfigured  # type: ignore
+
+    from django_kv import observability
+
+    try:
+        return observability._load_config().fast_path
+    except ImproperlyConfigured:
+        return False
+
+
+def _grpc_compression(compression: Optional[str]):
+    if compression is None or compression.lower() == "none":
+        return None
+    try:
+        return {"gzip": Compression.Gzip, "deflate": Compression.Deflate}[compression.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported OTLP compression {compression!r}; use 'gzip', 'deflate' or None"
+        ) from None
 
 
 def init_tracing(
     service_name: str = "django-kv",
     endpoint: Optional[str] = None,
     headers: Optional[Dict[str, str]] = None,
+    max_queue_size: int = 4096,
+    schedule_delay_millis: int = 1000,
+    max_export_batch_size: int = 512,
+    export_timeout_millis: int = 10000,
+    compression: Optional[str] = "gzip",
+    num_exporters: int = 1,
+    fast_path: Optional[bool] = None,
+    ring_capacity: int = 1 << 16,
 ):
     """
     Initialize a basic OTLP trace pipeline.
 
+    Spans are exported in the background by a ``BatchSpanProcessor``; prefer this over
+    ``SimpleSpanProcessor``, which exports synchronously on every span end.
+
     Args:
         service_name: Value for ``service.name`` resource attribute.
         endpoint: OTLP endpoint (grpc). Defaults to ``OTEL_EXPORTER_OTLP_ENDPOINT``.
         headers: Optional headers to send to collector.
+        max_queue_size: Spans buffered before new ones are dropped (absorbs bursts).
+        schedule_delay_millis: Maximum delay between two consecutive exports.
+        max_export_batch_size: Maximum number of spans per export request.
+        export_timeout_millis: How long an export may run before it is cancelled.
+        compression: gRPC compression for OTLP payloads: ``"gzip"``, ``"deflate"`` or None.
+        num_exporters: Number of exporter/processor pairs, each with its own gRPC channel.
+            Spans are distributed round-robin across them, which helps when a single
+            connection cannot keep up with span volume.
+        fast_path: Buffer spans in a bounded ring drained by a background thread instead
+            of a ``BatchSpanProcessor`` (see ``init_fast_tracing``). Defaults to
+            ``DJANGO_KV_OTEL["FAST_PATH"]``.
+        ring_capacity: Spans held by the ring before the oldest are dropped (fast path).
     """
     if trace is None or TracerProvider is None:
         raise ImportError("opentelemetry-sdk and otlp exporter are required for init_tracing")
+    if num_exporters < 1:
+        raise ValueError("num_exporters must be at least 1")
+    grpc_compression = _grpc_compression(compression)
 
     resource = Resource.create({"service.name": service_name})
     provider = TracerProvider(resource=resource)
     trace.set_tracer_provider(provider)
 
-    exporter = OTLPSpanExporter(endpoint=endpoint, headers=headers)
-    provider.add_span_processor(BatchSpanProcessor(exporter))
+    if fast_path is None:
+        fast_path = _fast_path_configured()
+
+    def make_processor():
+        exporter = OTLPSpanExporter(
+            endpoint=endpoint, headers=headers, compression=grpc_compression
+        )
+        if fast_path:
+            return _RingBufferSpanProcessor(
+                exporter,
+                capacity=ring_capacity,
+                schedule_delay_millis=schedule_delay_millis,
+                max_export_batch_size=max_export_batch_size,
+            )
+        return BatchSpanProcessor(
+            exporter,
+            max_queue_size=max_queue_size,
+            schedule_delay_millis=schedule_delay_millis,
+            max_export_batch_size=max_export_batch_size,
+            export_timeout_millis=export_timeout_millis,
+        )
+
+    processors = [make_processor() for _ in range(num_exporters)]
+    if num_exporters == 1:
+        provider.add_span_processor(processors[0])
+    else:
+        provider.add_span_processor(_RoundRobinSpanProcessor(processors))
     return provider
+
+
+def init_fast_tracing(
+    service_name: str = "django-kv",
+    capacity: int = 1 << 16,
+    **kwargs,
+):
+    """
+    Initialize an OTLP trace pipeline that keeps export work off the request thread.
+
+    Finished spans are appended to a bounded ring buffer and exported in bulk by a
+    background thread; under overload the oldest spans are dropped rather than blocking
+    or queueing unboundedly. Accepts the same keyword arguments as ``init_tracing``.
+
+    Args:
+        service_name: Value for ``service.name`` resource attribute.
+        capacity: Spans held by each ring before the oldest are dropped (a
+            ``ring_capacity`` keyword argument takes precedence).
+    """
+    kwargs["fast_path"] = True
+    kwargs.setdefault("ring_capacity", capacity)
+    return init_tracing(service_name=service_name, **kwargs)
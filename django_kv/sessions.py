@@ -4,6 +4,8 @@ Custom Django session backend backed by django-kv caches.
 
 from __future__ import annotations
 
+from typing import Any, Dict
+
 from django.conf import settings  # type: ignore
 from django.contrib.sessions.backends.base import SessionBase  # type: ignore
 from django.contrib.sessions.backends.cache import (  # type: ignore
@@ -11,11 +13,44 @@ from django.contrib.sessions.backends.cache import (  # type: ignore
     SessionStore as CacheSessionStore,
 )
 from django.core.cache import caches  # type: ignore
+from django.core.signals import setting_changed  # type: ignore
+from django.dispatch import receiver  # type: ignore
 
 from django_kv.observability import record_session_metrics, session_span
 
+# Session stores are built per request; resolve the cache alias once per class.
+_resolved_aliases: Dict[type, str] = {}
+
+
+@receiver(setting_changed)
+def _clear_resolved_aliases(*, setting: str, **kwargs: Any) -> None:
+    if setting in ("DJANGO_KV_SESSION_CACHE_ALIAS", "SESSION_CACHE_ALIAS"):
+        _resolved_aliases.clear()
+
+
+class CacheAliasMixin:
+    """
+    Resolve a session store's cache alias from settings, memoized per store class.
+
+    Subclasses set ``setting_name`` and ``default_alias``; SESSION_CACHE_ALIAS is used
+    when the setting is unset.
+    """
+
+    setting_name = "DJANGO_KV_SESSION_CACHE_ALIAS"
+    default_alias = "django_kv_sessions"
 
-class SessionStore(CacheSessionStore):
+    @classmethod
+    def _resolve_cache_alias(cls) -> str:
+        alias = _resolved_aliases.get(cls)
+        if alias is None:
+            alias = getattr(settings, cls.setting_name, None) or getattr(
+                settings, "SESSION_CACHE_ALIAS", cls.default_alias
+            )
+            _resolved_aliases[cls] = alias
+        return alias
+
+
+class SessionStore(CacheAliasMixin, CacheSessionStore):
     """
     Session backend that routes to a django-kv cache alias.
 
@@ -38,48 +73,42 @@ class SessionStore(CacheSessionStore):
         self._cache = caches[self._resolve_cache_alias()]
         SessionBase.__init__(self, session_key=session_key)
 
-    def _resolve_cache_alias(self) -> str:
-        alias = getattr(settings, self.setting_name, None)
-        if alias:
-            return alias
-        return getattr(settings, "SESSION_CACHE_ALIAS", self.default_alias)
-
     def load(self):
+        ok = False
         with session_span("load", self.session_key):
             try:
                 data = super().load()
-            except Exception:
-                record_session_metrics("load", False)
-                raise
-        record_session_metrics("load", True)
+                ok = True
+            finally:
+                record_session_metrics("load", ok)
         return data
 
     def save(self, must_create: bool = False):
+        ok = False
         with session_span("save", self.session_key):
             try:
                 result = super().save(must_create=must_create)
-            except Exception:
-                record_session_metrics("save", False)
-                raise
-        record_session_metrics("save", True)
+                ok = True
+            finally:
+                record_session_metrics("save", ok)
         return result
 
     def delete(self, session_key: str | None = None):
+        ok = False
         with session_span("delete", session_key or self.session_key):
             try:
                 result = super().delete(session_key=session_key)
-            except Exception:
-                record_session_metrics("delete", False)
-                raise
-        record_session_metrics("delete", True)
+                ok = True
+            finally:
+                record_session_metrics("delete", ok)
         return result
 
     def exists(self, session_key: str):
+        ok = False
         with session_span("exists", session_key):
             try:
                 result = super().exists(session_key)
-            except Exception:
-                record_session_metrics("exists", False)
-                raise
-        record_session_metrics("exists", True)
+                ok = True
+            finally:
+                record_session_metrics("exists", ok)
         return result
@@ -4,17 +4,18 @@ Async Django session backend backed by django-kv async caches.
 
 from __future__ import annotations
 
-from django.conf import settings  # type: ignore
 from django.contrib.sessions.backends.base import SessionBase  # type: ignore
 from django.contrib.sessions.backends.cache import (  # type: ignore
     KEY_PREFIX as DEFAULT_KEY_PREFIX,
 )
 from django.core.cache import caches  # type: ignore
 
+from django_kv.backends.async_base import DEFAULT_SYNC_TIMEOUT, _run_sync
 from django_kv.observability import record_session_metrics, session_span
+from django_kv.sessions import CacheAliasMixin
 
 
-class AsyncSessionStore(SessionBase):
+class AsyncSessionStore(CacheAliasMixin, SessionBase):
     """
     Async session backend that routes to a django-kv async cache alias.
 
@@ -27,6 +28,11 @@ class AsyncSessionStore(SessionBase):
 
     The alias must exist in `CACHES` and point to a django-kv async cache backend
     (e.g., AsyncMemoryCacheBackend).
+
+    The sync methods (used by SessionMiddleware under WSGI) run on the backend's shared
+    background loop while the a* methods run on the request's loop, so the cache's store
+    must not be bound to a single event loop (e.g. a redis.asyncio connection pool) if
+    both APIs are used.
     """
 
     cache_key_prefix = DEFAULT_KEY_PREFIX
@@ -37,39 +43,40 @@ class AsyncSessionStore(SessionBase):
         self._cache = caches[self._resolve_cache_alias()]
         SessionBase.__init__(self, session_key=session_key)
 
-    def _resolve_cache_alias(self) -> str:
-        alias = getattr(settings, self.setting_name, None)
-        if alias:
-            return alias
-        return getattr(settings, "SESSION_CACHE_ALIAS", self.default_alias)
-
     async def aload(self):
         """Async load session data from cache."""
+        ok = False
         with session_span("load", self.session_key):
             try:
                 data = await self._cache.aget(self.cache_key)
                 if data is None:
                     data = {}
                 self._session_cache = data
-            except Exception:
-                record_session_metrics("load", False)
-                raise
-        record_session_metrics("load", True)
+                ok = True
+            finally:
+                record_session_metrics("load", ok)
         return data
 
     async def asave(self, must_create: bool = False):
         """Async save session data to cache."""
+        if self.session_key is None:
+            # acreate() saves the new session, which records its own metrics
+            return await self.acreate()
+        ok = False
         with session_span("save", self.session_key):
             try:
-                if self.session_key is None:
-                    return self.create()
                 data = self._get_session(no_load=must_create)
                 await self._cache.aset(self.cache_key, data, timeout=self.get_expiry_age())
                 self._session_cache = data
-            except Exception:
-                record_session_metrics("save", False)
-                raise
-        record_session_metrics("save", True)
+                ok = True
+            finally:
+                record_session_metrics("save", ok)
+
+    async def acreate(self):
+        """Async create a new session with a fresh key and save it."""
+        self._session_key = await self._aget_new_session_key()
+        await self.asave(must_create=True)
+        self.modified = True
 
     async def adelete(self, session_key: str | None = None):
         """Async delete session from cache."""
@@ -77,71 +84,53 @@ class AsyncSessionStore(SessionBase):
             session_key = self.session_key
         if session_key is None:
             return
+        ok = False
         with session_span("delete", session_key):
             try:
                 cache_key = self.cache_key_prefix + session_key
                 await self._cache.adelete(cache_key)
-            except Exception:
-                record_session_metrics("delete", False)
-                raise
-        record_session_metrics("delete", True)
+                ok = True
+            finally:
+                record_session_metrics("delete", ok)
 
     async def aexists(self, session_key: str) -> bool:
         """Async check if session exists in cache."""
+        ok = True
         with session_span("exists", session_key):
             try:
                 cache_key = self.cache_key_prefix + session_key
                 result = await self._cache.ahas_key(cache_key)
             except Exception:
-                record_session_metrics("exists", False)
-                return False
-        record_session_metrics("exists", True)
+                ok = result = False
+            finally:
+                record_session_metrics("exists", ok)
         return result
 
-    # Sync methods delegate to async
+    @property
+    def _sync_timeout(self):
+        return getattr(self._cache, "_sync_timeout", DEFAULT_SYNC_TIMEOUT)
+
+    # Sync methods delegate to async on the backend's shared background loop, waiting at
+    # most the cache's SYNC_TIMEOUT
     def load(self):
         """Sync wrapper around aload."""
-        import asyncio
+        return _run_sync(self.aload(), self._sync_timeout)
 
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop.run_until_complete(self.aload())
+    def create(self):
+        """Sync wrapper around acreate."""
+        return _run_sync(self.acreate(), self._sync_timeout)
 
     def save(self, must_create: bool = False):
         """Sync wrapper around asave."""
-        import asyncio
-
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop.run_until_complete(self.asave(must_create))
+        return _run_sync(self.asave(must_create), self._sync_timeout)
 
     def delete(self, session_key: str | None = None):
         """Sync wrapper around adelete."""
-        import asyncio
-
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop.run_until_complete(self.adelete(session_key))
+        return _run_sync(self.adelete(session_key), self._sync_timeout)
 
     def exists(self, session_key: str) -> bool:
         """Sync wrapper around aexists."""
-        import asyncio
-
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop.run_until_complete(self.aexists(session_key))
+        return _run_sync(self.aexists(session_key), self._sync_timeout)
 
     @property
     def cache_key(self) -> str:
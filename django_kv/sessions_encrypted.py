@@ -4,7 +4,6 @@ Encrypted Django session backend using Fernet encryption.
 
 from __future__ import annotations
 
-from django.conf import settings  # type: ignore
 from django.contrib.sessions.backends.base import SessionBase  # type: ignore
 from django.contrib.sessions.backends.cache import (  # type: ignore
     KEY_PREFIX as DEFAULT_KEY_PREFIX,
@@ -14,9 +13,10 @@ from django.core.cache import caches  # type: ignore
 
 from django_kv.encryption import wrap_sync_with_fernet
 from django_kv.observability import record_session_metrics, session_span
+from django_kv.sessions import CacheAliasMixin
 
 
-class EncryptedSessionStore(CacheSessionStore):
+class EncryptedSessionStore(CacheAliasMixin, CacheSessionStore):
     """
     Encrypted session backend that wraps the underlying cache with Fernet encryption.
 
@@ -38,54 +38,50 @@ class EncryptedSessionStore(CacheSessionStore):
 
     def __init__(self, session_key: str | None = None) -> None:
         cache = caches[self._resolve_cache_alias()]
-        # Wrap the underlying key_value store with encryption
-        if hasattr(cache, "key_value"):
+        # Wrap the underlying key_value store with encryption, once per cache instance;
+        # the cache is shared, so re-wrapping would stack a Fernet layer per session.
+        if not getattr(cache, "_kv_fernet_wrapped", False) and hasattr(cache, "key_value"):
             cache.key_value = wrap_sync_with_fernet(cache.key_value)
+            cache._kv_fernet_wrapped = True
         self._cache = cache
         SessionBase.__init__(self, session_key=session_key)
 
-    def _resolve_cache_alias(self) -> str:
-        alias = getattr(settings, self.setting_name, None)
-        if alias:
-            return alias
-        return getattr(settings, "SESSION_CACHE_ALIAS", self.default_alias)
-
     def load(self):
+        ok = False
         with session_span("load", self.session_key):
             try:
                 data = super().load()
-            except Exception:
-                record_session_metrics("load", False)
-                raise
-        record_session_metrics("load", True)
+                ok = True
+            finally:
+                record_session_metrics("load", ok)
         return data
 
     def save(self, must_create: bool = False):
+        ok = False
         with session_span("save", self.session_key):
             try:
                 result = super().save(must_create=must_create)
-            except Exception:
-                record_session_metrics("save", False)
-                raise
-        record_session_metrics("save", True)
+                ok = True
+            finally:
+                record_session_metrics("save", ok)
         return result
 
     def delete(self, session_key: str | None = None):
+        ok = False
         with session_span("delete", session_key or self.session_key):
             try:
                 result = super().delete(session_key=session_key)
-            except Exception:
-                record_session_metrics("delete", False)
-                raise
-        record_session_metrics("delete", True)
+                ok = True
+            finally:
+                record_session_metrics("delete", ok)
         return result
 
     def exists(self, session_key: str):
+        ok = False
         with session_span("exists", session_key):
             try:
                 result = super().exists(session_key)
-            except Exception:
-                record_session_metrics("exists", False)
-                raise
-        record_session_metrics("exists", True)
+                ok = True
+            finally:
+                record_session_metrics("exists", ok)
         return result
@@ -2,6 +2,8 @@
 Utility functions for Django KV store.
 """
 
+from functools import lru_cache
+from importlib import import_module
 from typing import Optional, Dict, Any, TYPE_CHECKING
 
 try:
@@ -30,6 +32,34 @@ except ImportError:
 
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+# Stores built by get_kv_store(), keyed by the frozen KV_STORE config
+_STORE_CACHE: Dict[Any, KeyValue] = {}
+
+
+@receiver(setting_changed)
+def _clear_store_cache(*, setting: str, **kwargs: Any) -> None:
+    if setting == "KV_STORE":
+        _STORE_CACHE.clear()
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable equivalent of a (possibly nested) settings value."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _import_backend(dotted_path: str) -> Any:
+    module_path, class_name = dotted_path.rsplit(".", 1)
+    return getattr(import_module(module_path), class_name)
 
 
 def get_kv_store_config() -> Dict[str, Any]:
@@ -55,6 +85,9 @@ def get_kv_store() -> Optional[KeyValue]:
     This provides direct access to the py-key-value store without
     going through Django's cache framework.
 
+    Stores are memoized per configuration, so repeated calls return the same instance
+    (and share its data) until ``KV_STORE`` changes.
+
     Returns:
         KeyValue store instance or None if not configured
 
@@ -74,10 +107,17 @@ def get_kv_store() -> Optional[KeyValue]:
     if not backend_class:
         return None
 
+    try:
+        cache_key = _freeze(config)
+        return _STORE_CACHE[cache_key]
+    except TypeError:
+        # Unhashable option values: build a fresh store every call
+        cache_key = None
+    except KeyError:
+        pass
+
     # Import the backend class
-    module_path, class_name = backend_class.rsplit(".", 1)
-    module = __import__(module_path, fromlist=[class_name])
-    backend_class_obj = getattr(module, class_name)
+    backend_class_obj = _import_backend(backend_class)
 
     # Create backend instance - extract options from config
     # Options can be at top level or in OPTIONS dict
@@ -92,4 +132,7 @@ def get_kv_store() -> Optional[KeyValue]:
     backend = backend_class_obj(**backend_options)
 
     # Return the underlying KeyValue store
-    return backend.key_value
+    store = backend.key_value
+    if cache_key is not None:
+        _STORE_CACHE[cache_key] = store
+    return store
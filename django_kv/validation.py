@@ -12,6 +12,18 @@ from django.core.exceptions import ImproperlyConfigured  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Backend/engine path prefix identifying django-kv components
+_DJ_KV = "django_kv."
+
+# Wrapper types accepted in a cache's WRAPPERS list (encryption; zstd compression on async)
+_VALID_WRAPPERS = frozenset(("encryption", "compression"))
+
+# Backend path prefix of the async backends, the only ones implementing compression
+_DJ_KV_ASYNC = "django_kv.backends.async_"
+
+# Value encodings accepted by a sync cache's SERIALIZER option
+_VALID_SERIALIZERS = frozenset(("auto", "pickle", "msgpack"))
+
 
 def validate_cache_config(cache_alias: str, cache_config: Dict[str, Any]) -> None:
     """
@@ -27,7 +39,7 @@ def validate_cache_config(cache_alias: str, cache_config: Dict[str, Any]) -> Non
     backend = cache_config.get("BACKEND", "")
 
     # Check if it's a django-kv backend
-    if not backend.startswith("django_kv."):
+    if not backend.startswith(_DJ_KV):
         return  # Not our concern
 
     # Validate required fields
@@ -37,6 +49,13 @@ def validate_cache_config(cache_alias: str, cache_config: Dict[str, Any]) -> Non
             "Defaulting to 'django_cache'."
         )
 
+    serializer = cache_config.get("SERIALIZER", "auto")
+    if serializer not in _VALID_SERIALIZERS:
+        raise ImproperlyConfigured(
+            f"Cache '{cache_alias}': unknown SERIALIZER '{serializer}'. "
+            "Supported: 'auto', 'pickle', 'msgpack'"
+        )
+
     # Validate wrappers if present
     wrappers = cache_config.get("WRAPPERS", [])
     if wrappers:
@@ -50,17 +69,16 @@ def validate_cache_config(cache_alias: str, cache_config: Dict[str, Any]) -> Non
                     f"Cache '{cache_alias}': WRAPPERS[{i}] must be a dict, got {type(wrapper)}"
                 )
             wrapper_type = wrapper.get("type")
-            if wrapper_type == "encryption":
-                # Encryption wrapper is valid
-                pass
-            elif wrapper_type == "compression":
-                # Compression wrapper (future)
-                pass
-            else:
+            if wrapper_type not in _VALID_WRAPPERS:
                 raise ImproperlyConfigured(
                     f"Cache '{cache_alias}': WRAPPERS[{i}] has unknown type '{wrapper_type}'. "
                     "Supported: 'encryption', 'compression'"
                 )
+            if wrapper_type == "compression" and not backend.startswith(_DJ_KV_ASYNC):
+                raise ImproperlyConfigured(
+                    f"Cache '{cache_alias}': WRAPPERS[{i}] 'compression' is only supported "
+                    "by async backends"
+                )
 
 
 def validate_session_config() -> None:
@@ -71,7 +89,7 @@ def validate_session_config() -> None:
         ImproperlyConfigured: If configuration is invalid
     """
     session_engine = getattr(settings, "SESSION_ENGINE", None)
-    if not session_engine or not session_engine.startswith("django_kv."):
+    if not session_engine or not session_engine.startswith(_DJ_KV):
         return  # Not using django-kv sessions
 
     # Check that the session cache alias exists
@@ -91,7 +109,7 @@ def validate_session_config() -> None:
     # Validate the cache backend is a django-kv backend
     cache_config = caches[session_cache_alias]
     cache_backend = cache_config.get("BACKEND", "")
-    if not cache_backend.startswith("django_kv."):
+    if not cache_backend.startswith(_DJ_KV):
         logger.warning(
             f"Session engine '{session_engine}' uses cache alias '{session_cache_alias}' "
             f"with non-django-kv backend '{cache_backend}'. This may not work as expected."
@@ -107,9 +125,14 @@ def validate_all_settings() -> None:
     Raises:
         ImproperlyConfigured: If any configuration is invalid
     """
-    # Validate all cache configurations
+    # Validate django-kv cache configurations; other backends are skipped up front
     caches = getattr(settings, "CACHES", {})
-    for alias, config in caches.items():
+    kv_caches = {
+        alias: config
+        for alias, config in caches.items()
+        if isinstance(config, dict) and str(config.get("BACKEND", "")).startswith(_DJ_KV)
+    }
+    for alias, config in kv_caches.items():
         try:
             validate_cache_config(alias, config)
         except ImproperlyConfigured:
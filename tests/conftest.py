@@ -2,10 +2,12 @@
 Pytest configuration for django-kv tests.
 """
 
+import os
 from pathlib import Path
 import sys
 
 import django
+import pytest
 from django.conf import settings
 
 # Ensure py-key-value is available (either installed or vendored locally).
@@ -23,27 +25,56 @@ except ImportError:  # pragma: no cover - setup logic
 
     import key_value  # type: ignore  # noqa: F401
 
-# Configure Django settings for tests
-if not settings.configured:
+# Configure Django settings when pytest-django has not been pointed at tests.settings
+if not settings.configured and not os.environ.get("DJANGO_SETTINGS_MODULE"):
+    from tests import settings as test_settings
+
     settings.configure(
-        DEBUG=True,
-        SECRET_KEY="test-secret-key-for-testing-only",
-        INSTALLED_APPS=[
-            "django.contrib.auth",
-            "django.contrib.contenttypes",
-            "django.contrib.sessions",
-        ],
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        },
-        DATABASES={
-            "default": {
-                "ENGINE": "django.db.backends.sqlite3",
-                "NAME": ":memory:",
-            }
-        },
+        **{name: getattr(test_settings, name) for name in dir(test_settings) if name.isupper()}
     )
     django.setup()
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "otel: tests that need the OpenTelemetry SDK")
+
+
+@pytest.fixture(scope="session")
+def otel_provider():
+    """Install one in-memory TracerProvider for the whole session; yields (provider, exporter)."""
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    yield provider, exporter
+    provider.shutdown()
+
+
+@pytest.fixture(scope="session")
+def session_cache_aliases():
+    """Configure the session cache aliases once for the whole session."""
+    from django.test import override_settings
+
+    memory_cache = {
+        "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
+        "COLLECTION": "sessions",
+    }
+    override = override_settings(
+        CACHES={
+            **settings.CACHES,
+            "memory_sessions": memory_cache,
+            "django_kv_sessions": memory_cache,
+            "async_sessions": {
+                "BACKEND": "django_kv.backends.async_memory.AsyncMemoryCacheBackend",
+                "COLLECTION": "sessions",
+            },
+        }
+    )
+    override.enable()
+    yield
+    override.disable()
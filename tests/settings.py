@@ -0,0 +1,26 @@
+"""
+Django settings for the django-kv test suite.
+"""
+
+DEBUG = True
+SECRET_KEY = "test-secret-key-for-testing-only"
+
+INSTALLED_APPS = [
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sessions",
+]
+
+CACHES = {
+    "default": {
+        "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
+        "COLLECTION": "test_cache",
+    }
+}
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+}
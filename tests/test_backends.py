@@ -2,14 +2,22 @@
 Tests for Django KV store backends.
 """
 
-import time
+import os
+from datetime import timedelta
+
 import pytest
+from freezegun import freeze_time
 from django.core.cache import cache
 from django.test import override_settings
 from django_kv.backends.memory import MemoryCacheBackend
 
 
-@pytest.mark.django_db
+@pytest.fixture(scope="class")
+def memory_backend():
+    """One MemoryCacheBackend shared by a test class; its tests use distinct keys."""
+    return MemoryCacheBackend(collection="test_cache")
+
+
 class TestMemoryCacheBackend:
     """Tests for MemoryCacheBackend."""
 
@@ -19,61 +27,45 @@ class TestMemoryCacheBackend:
         assert backend.collection == "test_cache"
         assert backend.key_value is not None
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_basic_operations(self):
+    def test_basic_operations(self, memory_backend):
         """Test basic cache operations."""
         # Set a value
-        cache.set("test_key", "test_value", timeout=60)
+        memory_backend.set("test_key", "test_value", timeout=60)
 
         # Get the value
-        value = cache.get("test_key")
+        value = memory_backend.get("test_key")
         assert value == "test_value"
 
         # Delete the value
-        cache.delete("test_key")
+        memory_backend.delete("test_key")
 
         # Verify deletion
-        value = cache.get("test_key")
+        value = memory_backend.get("test_key")
         assert value is None
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_add_operation(self):
+    def test_add_non_positive_timeout(self, memory_backend):
+        """Test that add() with timeout <= 0 stores nothing and reports absence."""
+        assert memory_backend.add("expired_add", "value", timeout=0) is True
+        assert memory_backend.get("expired_add") is None
+        memory_backend.set("expired_add", "kept", timeout=60)
+        assert memory_backend.add("expired_add", "value", timeout=0) is False
+        assert memory_backend.get("expired_add") == "kept"
+
+    def test_add_operation(self, memory_backend):
         """Test add operation (only sets if key doesn't exist)."""
         # First add should succeed
-        result = cache.add("new_key", "new_value", timeout=60)
+        result = memory_backend.add("new_key", "new_value", timeout=60)
         assert result is True
 
         # Second add should fail (key exists)
-        result = cache.add("new_key", "different_value", timeout=60)
+        result = memory_backend.add("new_key", "different_value", timeout=60)
         assert result is False
 
         # Value should still be original
-        value = cache.get("new_key")
+        value = memory_backend.get("new_key")
         assert value == "new_value"
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_get_many_set_many(self):
+    def test_get_many_set_many(self, memory_backend):
         """Test bulk operations."""
         # Set multiple values
         data = {
@@ -81,24 +73,16 @@ class TestMemoryCacheBackend:
             "key2": "value2",
             "key3": "value3",
         }
-        cache.set_many(data, timeout=60)
+        memory_backend.set_many(data, timeout=60)
 
         # Get multiple values
-        results = cache.get_many(["key1", "key2", "key3", "key4"])
+        results = memory_backend.get_many(["key1", "key2", "key3", "key4"])
         assert results["key1"] == "value1"
         assert results["key2"] == "value2"
         assert results["key3"] == "value3"
         assert "key4" not in results or results["key4"] is None
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_complex_objects(self):
+    def test_complex_objects(self, memory_backend):
         """Test storing complex objects (lists, dicts)."""
         complex_obj = {
             "name": "Alice",
@@ -110,278 +94,169 @@ class TestMemoryCacheBackend:
             },
         }
 
-        cache.set("complex_key", complex_obj, timeout=60)
-        retrieved = cache.get("complex_key")
+        memory_backend.set("complex_key", complex_obj, timeout=60)
+        retrieved = memory_backend.get("complex_key")
 
         assert retrieved == complex_obj
         assert retrieved["name"] == "Alice"
         assert retrieved["hobbies"] == ["reading", "coding"]
         assert retrieved["metadata"]["active"] is True
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_has_key(self):
+    def test_has_key(self, memory_backend):
         """Test has_key operation."""
-        cache.set("exists_key", "value", timeout=60)
+        memory_backend.set("exists_key", "value", timeout=60)
 
-        assert cache.has_key("exists_key") is True
-        assert cache.has_key("nonexistent_key") is False
+        assert memory_backend.has_key("exists_key") is True
+        assert memory_backend.has_key("nonexistent_key") is False
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_timeout_expiration(self):
+    def test_timeout_expiration(self, memory_backend):
         """Test that values expire after timeout."""
-        # Set a value with a very short timeout
-        cache.set("expiring_key", "expiring_value", timeout=1)
+        with freeze_time("2024-01-01 00:00:00") as frozen:
+            # Set a value with a very short timeout
+            memory_backend.set("expiring_key", "expiring_value", timeout=1)
 
-        # Value should exist immediately
-        assert cache.get("expiring_key") == "expiring_value"
+            # Value should exist immediately
+            assert memory_backend.get("expiring_key") == "expiring_value"
 
-        # Wait for expiration
-        time.sleep(1.1)
+            # Advance the clock past the timeout
+            frozen.tick(delta=timedelta(seconds=2))
 
-        # Value should be None after expiration
-        assert cache.get("expiring_key") is None
+            # Value should be None after expiration
+            assert memory_backend.get("expiring_key") is None
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_no_timeout(self):
+    def test_no_timeout(self, memory_backend):
         """Test setting values without timeout."""
-        cache.set("no_timeout_key", "no_timeout_value", timeout=None)
+        with freeze_time("2024-01-01 00:00:00") as frozen:
+            memory_backend.set("no_timeout_key", "no_timeout_value", timeout=None)
 
-        # Value should persist
-        assert cache.get("no_timeout_key") == "no_timeout_value"
+            # Value should persist
+            assert memory_backend.get("no_timeout_key") == "no_timeout_value"
 
-        # Wait a bit and verify it's still there
-        time.sleep(0.1)
-        assert cache.get("no_timeout_key") == "no_timeout_value"
+            # Still there long after any default timeout would have passed
+            frozen.tick(delta=timedelta(days=1))
+            assert memory_backend.get("no_timeout_key") == "no_timeout_value"
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_key_versioning(self):
+    def test_key_versioning(self, memory_backend):
         """Test Django cache key versioning."""
         # Set value with version 1
-        cache.set("versioned_key", "version1", version=1, timeout=60)
-        assert cache.get("versioned_key", version=1) == "version1"
-        assert cache.get("versioned_key", version=2) is None
+        memory_backend.set("versioned_key", "version1", version=1, timeout=60)
+        assert memory_backend.get("versioned_key", version=1) == "version1"
+        assert memory_backend.get("versioned_key", version=2) is None
 
         # Set value with version 2
-        cache.set("versioned_key", "version2", version=2, timeout=60)
-        assert cache.get("versioned_key", version=1) == "version1"
-        assert cache.get("versioned_key", version=2) == "version2"
+        memory_backend.set("versioned_key", "version2", version=2, timeout=60)
+        assert memory_backend.get("versioned_key", version=1) == "version1"
+        assert memory_backend.get("versioned_key", version=2) == "version2"
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-                "KEY_PREFIX": "test_prefix",
-            }
-        }
-    )
     def test_key_prefix(self):
         """Test key prefixing."""
-        cache.set("prefixed_key", "prefixed_value", timeout=60)
-        value = cache.get("prefixed_key")
+        backend = MemoryCacheBackend(
+            params={"COLLECTION": "test_cache", "KEY_PREFIX": "test_prefix"}
+        )
+        backend.set("prefixed_key", "prefixed_value", timeout=60)
+        assert backend.make_key("prefixed_key").startswith("test_prefix:")
+        value = backend.get("prefixed_key")
         assert value == "prefixed_value"
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_delete_many(self):
+    def test_delete_many(self, memory_backend):
         """Test delete_many operation."""
         # Set multiple values
-        cache.set("delete1", "value1", timeout=60)
-        cache.set("delete2", "value2", timeout=60)
-        cache.set("delete3", "value3", timeout=60)
+        memory_backend.set("delete1", "value1", timeout=60)
+        memory_backend.set("delete2", "value2", timeout=60)
+        memory_backend.set("delete3", "value3", timeout=60)
 
         # Verify they exist
-        assert cache.get("delete1") == "value1"
-        assert cache.get("delete2") == "value2"
-        assert cache.get("delete3") == "value3"
+        assert memory_backend.get("delete1") == "value1"
+        assert memory_backend.get("delete2") == "value2"
+        assert memory_backend.get("delete3") == "value3"
 
         # Delete multiple keys
-        cache.delete_many(["delete1", "delete2"])
+        memory_backend.delete_many(["delete1", "delete2"])
 
         # Verify deletion
-        assert cache.get("delete1") is None
-        assert cache.get("delete2") is None
-        assert cache.get("delete3") == "value3"
+        assert memory_backend.get("delete1") is None
+        assert memory_backend.get("delete2") is None
+        assert memory_backend.get("delete3") == "value3"
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_none_values(self):
+    def test_none_values(self, memory_backend):
         """Test storing and retrieving None values."""
-        cache.set("none_key", None, timeout=60)
-        value = cache.get("none_key")
+        memory_backend.set("none_key", None, timeout=60)
+        value = memory_backend.get("none_key")
         assert value is None
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_empty_string(self):
+    def test_empty_string(self, memory_backend):
         """Test storing empty strings."""
-        cache.set("empty_key", "", timeout=60)
-        value = cache.get("empty_key")
+        memory_backend.set("empty_key", "", timeout=60)
+        value = memory_backend.get("empty_key")
         assert value == ""
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_default_value(self):
+    def test_default_value(self, memory_backend):
         """Test get with default value."""
         # Non-existent key should return default
-        value = cache.get("nonexistent", default="default_value")
+        value = memory_backend.get("nonexistent", default="default_value")
         assert value == "default_value"
 
         # Existing key should return actual value
-        cache.set("existing", "actual_value", timeout=60)
-        value = cache.get("existing", default="default_value")
+        memory_backend.set("existing", "actual_value", timeout=60)
+        value = memory_backend.get("existing", default="default_value")
         assert value == "actual_value"
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
+    @pytest.mark.parametrize(
+        "key,value",
+        [
+            ("int_key", 42),
+            ("float_key", 3.14),
+            ("bool_key", True),
+            ("list_key", [1, 2, 3]),
+            ("tuple_key", (1, 2, 3)),
+        ],
     )
-    def test_different_data_types(self):
+    def test_different_data_types(self, memory_backend, key, value):
         """Test storing various data types."""
-        # Integer
-        cache.set("int_key", 42, timeout=60)
-        assert cache.get("int_key") == 42
-
-        # Float
-        cache.set("float_key", 3.14, timeout=60)
-        assert cache.get("float_key") == 3.14
-
-        # Boolean
-        cache.set("bool_key", True, timeout=60)
-        assert cache.get("bool_key") is True
-
-        # List
-        cache.set("list_key", [1, 2, 3], timeout=60)
-        assert cache.get("list_key") == [1, 2, 3]
+        memory_backend.set(key, value, timeout=60)
+        result = memory_backend.get(key)
+        assert result == value and type(result) is type(value)
 
-        # Tuple (will be serialized as list)
-        cache.set("tuple_key", (1, 2, 3), timeout=60)
-        result = cache.get("tuple_key")
-        # Tuple might be deserialized as list depending on serialization
-        assert result in [(1, 2, 3), [1, 2, 3]]
-
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
+    def test_bulk_round_trip(self, memory_backend):
+        """Test that set_many/get_many round-trip mixed values in one call each."""
+        data = {
+            "bulk_int": 42,
+            "bulk_float": 3.14,
+            "bulk_bool": True,
+            "bulk_str": "text",
+            "bulk_list": [1, 2, 3],
+            "bulk_dict": {"nested": {"a": 1}},
+            "bulk_tuple": (1, 2, 3),
         }
-    )
-    def test_pickle_serialization(self):
+        memory_backend.set_many(data, timeout=60)
+        assert memory_backend.get_many(list(data)) == data
+
+    def test_pickle_serialization(self, memory_backend):
         """Test that complex objects requiring pickle work."""
         # Use a module-level class that can be pickled
         from types import SimpleNamespace
 
         obj = SimpleNamespace(value="test", number=42)
-        cache.set("custom_obj", obj, timeout=60)
-        retrieved = cache.get("custom_obj")
+        memory_backend.set("custom_obj", obj, timeout=60)
+        retrieved = memory_backend.get("custom_obj")
         assert retrieved.value == "test"
         assert retrieved.number == 42
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_empty_get_many(self):
+    def test_empty_get_many(self, memory_backend):
         """Test get_many with empty list."""
-        result = cache.get_many([])
+        result = memory_backend.get_many([])
         assert result == {}
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_empty_set_many(self):
+    def test_empty_set_many(self, memory_backend):
         """Test set_many with empty dict."""
         # Should not raise an error
-        cache.set_many({})
+        memory_backend.set_many({})
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_empty_delete_many(self):
+    def test_empty_delete_many(self, memory_backend):
         """Test delete_many with empty list."""
         # Should not raise an error
-        cache.delete_many([])
+        memory_backend.delete_many([])
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
     def test_collection_isolation(self):
         """Test that different collections are isolated."""
         backend1 = MemoryCacheBackend(collection="collection1")
@@ -393,21 +268,12 @@ class TestMemoryCacheBackend:
         assert backend1.get("shared_key") == "value1"
         assert backend2.get("shared_key") == "value2"
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_clear_not_implemented(self):
+    def test_clear_not_implemented(self, memory_backend):
         """Test that clear raises NotImplementedError."""
         with pytest.raises(NotImplementedError):
-            cache.clear()
+            memory_backend.clear()
 
 
-@pytest.mark.django_db
 class TestRedisCacheBackend:
     """Tests for RedisCacheBackend."""
 
@@ -434,3 +300,419 @@ class TestRedisCacheBackend:
         cache.set("redis_key", "redis_value", timeout=60)
         value = cache.get("redis_key")
         assert value == "redis_value"
+
+    def _backend(self, monkeypatch, store):
+        from django_kv.backends import redis as redis_backend
+
+        monkeypatch.setattr(redis_backend, "RedisStore", lambda **kwargs: store)
+        return redis_backend.RedisCacheBackend(collection="test_cache")
+
+    def test_add_round_trips_through_redis_store(self, monkeypatch):
+        """Test that add() writes JSON RedisStore.get reads back, only when absent."""
+        if not os.environ.get("DJANGO_KV_REQUIRE_REDIS_STORE"):
+            # CI sets DJANGO_KV_REQUIRE_REDIS_STORE so drift in RedisStore internals fails
+            pytest.importorskip("key_value.sync.stores.redis")
+            pytest.importorskip("fakeredis")
+        import fakeredis
+        from key_value.sync.stores.redis import RedisStore
+
+        store = RedisStore(client=fakeredis.FakeRedis(decode_responses=True))
+        backend = self._backend(monkeypatch, store)
+
+        assert backend.add("key", {"nested": [1, 2]}, timeout=60) is True
+        assert backend.add("key", "other", timeout=60) is False
+        assert backend.get("key") == {"nested": [1, 2]}
+        stored = store.get(key=backend._make_key("key"), collection="test_cache")
+        assert stored == backend._serialize({"nested": [1, 2]})
+
+    def test_add_non_positive_timeout_skips_write(self, monkeypatch):
+        """Test that add() with timeout <= 0 stores nothing and reports absence."""
+        from unittest import mock
+
+        class Store:
+            accepts_bytes = False
+            _adapter = object()
+
+            def __init__(self):
+                self._client = mock.Mock()
+                self.get = mock.Mock(return_value=None)
+                self.put = mock.Mock()
+                self.delete = mock.Mock()
+
+        store = Store()
+        backend = self._backend(monkeypatch, store)
+        assert backend.add("key", "value", timeout=0) is True
+        assert backend.add("key", "value", timeout=-1) is True
+        store.get.return_value = {"type": "json", "data": "existing"}
+        assert backend.add("key", "value", timeout=0) is False
+        store.put.assert_not_called()
+        store._client.set.assert_not_called()
+
+    def test_add_falls_back_when_store_internals_change(self, monkeypatch, caplog):
+        """Test that add() logs and uses the generic path if RedisStore internals differ."""
+        from unittest import mock
+
+        class Adapter:
+            def dump_json(self, **kwargs):
+                raise TypeError("unexpected keyword argument")
+
+        class Store:
+            accepts_bytes = False
+            _adapter = Adapter()
+
+            def __init__(self):
+                self._client = mock.Mock()
+                self.data = {}
+
+            def setup_collection(self, collection):
+                pass
+
+            def get(self, key, collection=None):
+                return self.data.get(key)
+
+            def put(self, key, value, collection=None, ttl=None):
+                self.data[key] = value
+
+            def delete(self, key, collection=None):
+                return self.data.pop(key, None) is not None
+
+        store = Store()
+        backend = self._backend(monkeypatch, store)
+        with caplog.at_level("WARNING", logger="django_kv.backends.redis"):
+            assert backend.add("key", "value", timeout=60) is True
+        assert "non-atomic fallback" in caplog.text
+        assert backend.get("key") == "value"
+        store._client.set.assert_not_called()
+
+
+class TestAsyncKeyValueCacheBackend:
+    """Tests for AsyncKeyValueCacheBackend."""
+
+    def test_add_uses_put_if_absent(self):
+        """Test that aadd delegates to the store's atomic put_if_absent."""
+        import asyncio
+
+        from key_value.aio.stores.memory import MemoryStore
+        from django_kv.backends.async_base import AsyncKeyValueCacheBackend
+
+        class PutIfAbsentStore(MemoryStore):
+            calls = 0
+
+            async def put_if_absent(self, key, value, collection=None, ttl=None):
+                type(self).calls += 1
+                if await self.get(key=key, collection=collection) is not None:
+                    return False
+                await self.put(key=key, value=value, collection=collection, ttl=ttl)
+                return True
+
+        backend = AsyncKeyValueCacheBackend(key_value=PutIfAbsentStore(), collection="test_cache")
+
+        async def run():
+            assert await backend.aadd("add_key", "first", timeout=60) is True
+            assert await backend.aadd("add_key", "second", timeout=60) is False
+            return await backend.aget("add_key")
+
+        assert asyncio.run(run()) == "first"
+        assert PutIfAbsentStore.calls == 2
+
+    def test_sync_wrappers_time_out(self):
+        """Test that a stalled store call raises TimeoutError after SYNC_TIMEOUT."""
+        import asyncio
+
+        from key_value.aio.stores.memory import MemoryStore
+        from django_kv.backends.async_base import AsyncKeyValueCacheBackend
+
+        class StalledStore(MemoryStore):
+            async def get(self, key, collection=None):
+                await asyncio.sleep(60)
+
+        backend = AsyncKeyValueCacheBackend(
+            params={"SYNC_TIMEOUT": 0.05}, key_value=StalledStore(), collection="test_cache"
+        )
+        with pytest.raises(TimeoutError):
+            backend.get("stalled")
+        # The background loop is still usable after a timeout
+        backend.set("fine", "value", timeout=60)
+
+    def test_has_key_uses_exists(self):
+        """Test that ahas_key prefers the store's exists over a full get."""
+        import asyncio
+
+        from key_value.aio.stores.memory import MemoryStore
+        from django_kv.backends.async_base import AsyncKeyValueCacheBackend
+
+        class ExistsStore(MemoryStore):
+            async def exists(self, key, collection=None):
+                return await super().get(key=key, collection=collection) is not None
+
+            async def get(self, key, collection=None):
+                raise AssertionError("ahas_key should not fetch the value")
+
+        backend = AsyncKeyValueCacheBackend(key_value=ExistsStore(), collection="test_cache")
+
+        async def run():
+            await backend.aset("exists_key", "value", timeout=60)
+            return await backend.ahas_key("exists_key"), await backend.ahas_key("missing_key")
+
+        assert asyncio.run(run()) == (True, False)
+
+    def test_default_timeout(self):
+        """Test that DEFAULT_TIMEOUT resolves to the TIMEOUT setting."""
+        import asyncio
+
+        from django.core.cache.backends.base import DEFAULT_TIMEOUT
+        from django_kv.backends.async_memory import AsyncMemoryCacheBackend
+
+        backend = AsyncMemoryCacheBackend(params={"TIMEOUT": 120})
+        assert backend._ttl(DEFAULT_TIMEOUT) == 120.0
+        assert backend._ttl(None) is None
+        assert backend._ttl(5) == 5.0
+
+        async def run():
+            await backend.aset("default_timeout_key", "value")
+            return await backend.aget("default_timeout_key")
+
+        assert asyncio.run(run()) == "value"
+
+    def test_get_or_set(self):
+        """Test aget_or_set stores the default only on a miss."""
+        import asyncio
+
+        from django_kv.backends.async_memory import AsyncMemoryCacheBackend
+
+        backend = AsyncMemoryCacheBackend(collection="test_cache")
+
+        async def run():
+            first = await backend.aget_or_set("get_or_set_key", lambda: "computed", timeout=60)
+            second = await backend.aget_or_set("get_or_set_key", "ignored", timeout=60)
+            return first, second
+
+        assert asyncio.run(run()) == ("computed", "computed")
+
+    def test_versioned_collections(self):
+        """Test that key prefix and version select the collection, not the key."""
+        import asyncio
+
+        from django_kv.backends.async_memory import AsyncMemoryCacheBackend
+
+        backend = AsyncMemoryCacheBackend(
+            collection="test_cache",
+            params={"KEY_PREFIX": "p", "VERSION": 3, "COLLECTION_PER_VERSION": True},
+        )
+        assert backend._make_key_fast("key") == "key"
+        assert backend._coll() == "test_cache:p:3"
+        assert backend._coll(4) == "test_cache:p:4"
+        # Only the default version's collection name is memoized
+        assert backend._default_coll == (3, "test_cache:p:3")
+
+        async def run():
+            await backend.aset("key", "v3", timeout=60)
+            await backend.aset("key", "v4", timeout=60, version=4)
+            stored = await backend.key_value.get(key="key", collection="test_cache:p:3")
+            return stored, await backend.aget("key"), await backend.aget("key", version=4)
+
+        assert asyncio.run(run()) == ({"type": "json", "data": "v3"}, "v3", "v4")
+
+    def test_flat_keys(self):
+        """Test that prefix and version stay in the key by default, as in earlier releases."""
+        import asyncio
+
+        from django_kv.backends.async_memory import AsyncMemoryCacheBackend
+
+        backend = AsyncMemoryCacheBackend(
+            collection="test_cache", params={"KEY_PREFIX": "p", "VERSION": 3}
+        )
+        assert backend._make_key_fast("key") == "p:3:key"
+        assert backend._make_key_fast("key", 4) == "p:4:key"
+        assert backend._coll(4) == "test_cache"
+
+        async def run():
+            await backend.aset("key", "v3", timeout=60)
+            return await backend.key_value.get(key="p:3:key", collection="test_cache")
+
+        assert asyncio.run(run()) == {"type": "json", "data": "v3"}
+
+    def test_wrappers(self):
+        """Test that wrappers are dispatched by type and unknown types are rejected."""
+        from django_kv.backends import async_base
+        from django_kv.backends.async_memory import AsyncMemoryCacheBackend
+
+        calls = []
+
+        def make_wrapper(backend, store, config):
+            calls.append(config)
+            return store
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setitem(async_base._WRAPPER_REGISTRY, "custom", make_wrapper)
+            AsyncMemoryCacheBackend(params={"WRAPPERS": [{"type": "custom", "option": 1}]})
+        assert calls == [{"type": "custom", "option": 1}]
+
+        with pytest.raises(ValueError, match="Unknown wrapper type"):
+            AsyncMemoryCacheBackend(params={"WRAPPERS": [{"type": "bogus"}]})
+
+    def test_sync_wrappers(self):
+        """Test that sync methods run on the shared loop and refuse a running loop."""
+        import asyncio
+
+        from django_kv.backends.async_memory import AsyncMemoryCacheBackend
+
+        backend = AsyncMemoryCacheBackend(collection="test_cache")
+        backend.set("sync_key", "value", 60)
+        assert backend.get("sync_key") == "value"
+        assert backend.delete("sync_key") is True
+        assert backend.get("sync_key", default="missing") == "missing"
+
+        async def run():
+            with pytest.raises(RuntimeError, match="running event loop"):
+                backend.get("sync_key")
+
+        asyncio.run(run())
+
+    def test_make_keys(self):
+        """Test batch key building in both key layouts, including non-str keys."""
+        from django_kv.backends.async_memory import AsyncMemoryCacheBackend
+
+        backend = AsyncMemoryCacheBackend(
+            params={"KEY_PREFIX": "p", "VERSION": 3, "COLLECTION_PER_VERSION": True}
+        )
+        assert backend._make_keys(["a", "b"]) == ["a", "b"]
+        assert backend._make_keys(["a", 1]) == ["a", "1"]
+
+        flat = AsyncMemoryCacheBackend(params={"KEY_PREFIX": "p", "VERSION": 3})
+        assert flat._make_keys(["a", "b"]) == ["p:3:a", "p:3:b"]
+        assert flat._make_keys(["a", 1], version=4) == ["p:4:a", "p:4:1"]
+
+
+class TestKeyValueCacheBackendDirect:
+    """Tests for KeyValueCacheBackend used directly, outside django.core.cache."""
+
+    def test_make_key(self):
+        """Test that keys follow the prefix:version:key layout."""
+        backend = MemoryCacheBackend(params={"KEY_PREFIX": "p", "VERSION": 3})
+        assert backend._make_key("k") == "p:3:k"
+        assert backend._make_key("k", 4) == "p:4:k"
+        assert backend._make_key(b"k") == "p:3:k"
+        backend.version = 9
+        assert backend._make_key("k") == "p:9:k"
+
+    def test_make_keys(self):
+        """Test batch key construction, including non-str keys."""
+        backend = MemoryCacheBackend(params={"KEY_PREFIX": "p", "VERSION": 3})
+        assert backend._make_keys(["a", "b"]) == ["p:3:a", "p:3:b"]
+        assert backend._make_keys(["a", 1], version=4) == ["p:4:a", "p:4:1"]
+
+    def test_compression_wrapper_unsupported(self, caplog):
+        """Test that sync backends warn about, and validation rejects, compression."""
+        from django.core.exceptions import ImproperlyConfigured
+
+        from django_kv.validation import validate_cache_config
+
+        wrappers = [{"type": "compression"}]
+        with caplog.at_level("WARNING", logger="django_kv.backends.base"):
+            MemoryCacheBackend(params={"WRAPPERS": wrappers})
+        assert "'compression' wrapper is not supported by MemoryCacheBackend" in caplog.text
+
+        with pytest.raises(ImproperlyConfigured, match="only supported by async backends"):
+            validate_cache_config(
+                "default",
+                {"BACKEND": "django_kv.backends.memory.MemoryCacheBackend", "WRAPPERS": wrappers},
+            )
+        validate_cache_config(
+            "default",
+            {
+                "BACKEND": "django_kv.backends.async_memory.AsyncMemoryCacheBackend",
+                "WRAPPERS": wrappers,
+            },
+        )
+
+    def test_add_checks_existence_not_value(self):
+        """Test that add() treats a stored None as present and skips deserialization."""
+        backend = MemoryCacheBackend(collection="test_cache")
+        backend.set("none_key", None, timeout=60)
+        backend._deserialize = None  # add() must not deserialize the existing entry
+        assert backend.add("none_key", "value", timeout=60) is False
+        assert backend.add("fresh_key", "value", timeout=60) is True
+
+    def test_add_uses_put_if_absent(self):
+        """Test that add() defers to the store's put_if_absent when available."""
+        backend = MemoryCacheBackend(collection="test_cache")
+        calls = []
+
+        class ConditionalStore(type(backend.key_value)):
+            def put_if_absent(self, key, value, collection=None, ttl=None):
+                calls.append((key, ttl))
+                return True
+
+        backend.key_value = ConditionalStore()
+        assert backend.add("cond_key", "value", timeout=30) is True
+        assert calls == [(backend._make_key("cond_key"), 30.0)]
+
+    def test_store_capabilities_follow_key_value(self):
+        """Test that re-assigning key_value recomputes the store capability flags."""
+        backend = MemoryCacheBackend(collection="test_cache")
+        store_cls = type(backend.key_value)
+
+        class BytesStore(store_cls):
+            accepts_bytes = True
+
+            def put_if_absent(self, key, value, collection=None, ttl=None):
+                return True
+
+        backend.key_value = BytesStore()
+        assert backend._has_put_if_absent and backend._store_accepts_bytes
+        # A wrapper without these capabilities (e.g. encryption) turns them off again
+        backend.key_value = store_cls()
+        assert not backend._has_put_if_absent and not backend._store_accepts_bytes
+        assert backend.add("key", {1, 2}, timeout=30) is True
+        assert isinstance(
+            backend.key_value.get(key=backend._make_key("key"), collection="test_cache")["data"],
+            str,
+        )
+
+    def test_default_timeout(self):
+        """Test that DEFAULT_TIMEOUT resolves to the TIMEOUT setting."""
+        from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+        backend = MemoryCacheBackend(params={"TIMEOUT": 120})
+        assert backend._ttl(DEFAULT_TIMEOUT) == 120.0
+        assert backend._ttl(None) is None
+        backend.set("default_timeout_key", "value")
+        assert backend.get("default_timeout_key") == "value"
+        assert backend.add("default_timeout_add", "value") is True
+
+    def test_memory_values_are_isolated(self):
+        """Test that values read back are copies, as with Django's locmem cache."""
+        backend = MemoryCacheBackend(collection="test_cache")
+        value = {"items": [1, 2]}
+        backend.set("isolated_key", value, timeout=60)
+        value["items"].append(3)
+        cached = backend.get("isolated_key")
+        assert cached == {"items": [1, 2]}
+        cached["items"].append(4)
+        assert backend.get("isolated_key") == {"items": [1, 2]}
+
+    def test_reassigned_store_is_used(self):
+        """Test that replacing key_value (e.g. re-wrapping it) rebinds store methods."""
+        backend = MemoryCacheBackend(collection="test_cache")
+        calls = []
+
+        class RecordingStore:
+            def __init__(self, store):
+                self.store = store
+
+            def get(self, key, collection=None):
+                calls.append(key)
+                return self.store.get(key=key, collection=collection)
+
+            def put(self, key, value, collection=None, ttl=None):
+                self.store.put(key=key, value=value, collection=collection, ttl=ttl)
+
+            def delete(self, key, collection=None):
+                return self.store.delete(key=key, collection=collection)
+
+        backend.set_many({"a": 1, "b": 2}, timeout=60)
+        backend.key_value = RecordingStore(backend.key_value)
+        assert backend.get("a") == 1
+        assert backend.get_many(["a", "b"]) == {"a": 1, "b": 2}
+        assert calls == [backend._make_key(k) for k in ("a", "a", "b")]
@@ -0,0 +1,28 @@
+"""
+Benchmarks for the bulk cache operations.
+"""
+
+import pytest
+
+from django_kv.backends.memory import MemoryCacheBackend
+
+pytest.importorskip("pytest_benchmark")
+
+BULK_DATA = {f"k{i}": i for i in range(1000)}
+
+
+@pytest.fixture
+def bench_backend():
+    return MemoryCacheBackend(collection="bench_cache")
+
+
+@pytest.mark.benchmark(group="bulk")
+def test_set_many_1000(benchmark, bench_backend):
+    benchmark(bench_backend.set_many, BULK_DATA, 60)
+    assert bench_backend.get_many(list(BULK_DATA)) == BULK_DATA
+
+
+@pytest.mark.benchmark(group="bulk")
+def test_get_many_1000(benchmark, bench_backend):
+    bench_backend.set_many(BULK_DATA, timeout=60)
+    assert benchmark(bench_backend.get_many, list(BULK_DATA)) == BULK_DATA
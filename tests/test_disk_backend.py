@@ -2,31 +2,40 @@
 Tests for DiskCacheBackend.
 """
 
+import importlib.util
+
 import pytest
 
-pytest.importorskip("diskcache")
+from django_kv.backends.disk import DiskCacheBackend
+
+pytestmark = pytest.mark.skipif(
+    importlib.util.find_spec("diskcache") is None, reason="diskcache not installed"
+)
+
+
+@pytest.fixture
+def disk_dir(tmp_path):
+    return tmp_path / "disk-cache"
 
-from django_kv.backends.disk import DiskCacheBackend  # noqa: E402
 
+@pytest.fixture
+def disk_backend(disk_dir):
+    backend = DiskCacheBackend(directory=str(disk_dir), collection="disk_cache")
+    yield backend
+    backend.close()
 
-@pytest.mark.django_db
-def test_disk_backend_basic(tmp_path):
-    cache_dir = tmp_path / "disk-cache"
-    backend = DiskCacheBackend(directory=str(cache_dir), collection="disk_cache")
 
-    backend.set("disk_key", {"value": 42}, timeout=60)
-    assert backend.get("disk_key") == {"value": 42}
+def test_disk_backend_basic(disk_backend):
+    disk_backend.set("disk_key", {"value": 42}, timeout=60)
+    assert disk_backend.get("disk_key") == {"value": 42}
 
-    backend.delete("disk_key")
-    assert backend.get("disk_key") is None
+    disk_backend.delete("disk_key")
+    assert disk_backend.get("disk_key") is None
 
 
-@pytest.mark.django_db
-def test_disk_backend_persistence(tmp_path):
-    cache_dir = tmp_path / "disk-cache"
-    backend = DiskCacheBackend(directory=str(cache_dir))
-    backend.set("persist", "value", timeout=60)
+def test_disk_backend_persistence(disk_backend, disk_dir):
+    disk_backend.set("persist", "value", timeout=60)
 
-    # Recreate backend pointing to same directory, value should remain.
-    backend2 = DiskCacheBackend(directory=str(cache_dir))
-    assert backend2.get("persist") == "value"
+    # A second backend on the same directory sees what the first one wrote.
+    reopened = DiskCacheBackend(directory=str(disk_dir), collection="disk_cache")
+    assert reopened.get("persist") == "value"
@@ -0,0 +1,98 @@
+"""
+Tests for encryption key resolution.
+"""
+
+import base64
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+from django_kv import encryption
+
+
+class TestFernetKey:
+    """Tests for Fernet key derivation and caching."""
+
+    def test_derivation_is_memoized(self):
+        """Test that deriving from the same secret reuses the cached key."""
+        encryption._derive_fernet_key_from_secret_key.cache_clear()
+        first = encryption._derive_fernet_key_from_secret_key("secret")
+        second = encryption._derive_fernet_key_from_secret_key("secret")
+        assert first is second
+        assert encryption._derive_fernet_key_from_secret_key.cache_info().hits == 1
+
+    def test_settings_key_follows_setting_changes(self):
+        """Test that the settings-derived key is recomputed when SECRET_KEY changes."""
+        with override_settings(SECRET_KEY="first-secret"):
+            first = encryption._get_fernet_key()
+            assert encryption._get_fernet_key() is first
+        with override_settings(SECRET_KEY="second-secret"):
+            second = encryption._get_fernet_key()
+        assert second != first
+        assert second == encryption._derive_fernet_key_from_secret_key("second-secret")
+
+    def test_fernet_key_bytes_pass_through(self):
+        """Test that a Fernet key given as bytes is used unchanged."""
+        from cryptography.fernet import Fernet
+
+        fernet_key = Fernet.generate_key()
+        assert encryption._get_fernet_key(fernet_key) == fernet_key
+
+    def test_fernet_key_str_pass_through(self):
+        """Test that a Fernet key string keeps the key material older releases decoded."""
+        from cryptography.fernet import Fernet
+
+        fernet_key = Fernet.generate_key()
+        resolved = encryption._get_fernet_key(fernet_key.decode())
+        assert resolved == fernet_key
+        assert base64.urlsafe_b64decode(resolved) == base64.urlsafe_b64decode(fernet_key)
+
+    def test_other_strings_are_derived(self):
+        """Test that strings that are not Fernet keys are hashed into one."""
+        assert encryption._get_fernet_key(
+            "not-a-fernet-key"
+        ) == encryption._derive_fernet_key_from_secret_key("not-a-fernet-key")
+
+    def test_raw_32_bytes_are_encoded(self):
+        """Test that 32 raw bytes are base64-encoded into a Fernet key."""
+        raw = b"r" * 32
+        assert encryption._get_fernet_key(raw) == base64.urlsafe_b64encode(raw)
+
+    def test_invalid_bytes_rejected(self):
+        """Test that bytes that are neither a Fernet key nor 32 raw bytes are rejected."""
+        with pytest.raises(ImproperlyConfigured):
+            encryption._get_fernet_key(b"short")
+
+    def test_settings_key_uses_same_coercion(self):
+        """Test that DJANGO_KV_ENCRYPTION_KEY accepts the same key forms."""
+        raw = b"s" * 32
+        with override_settings(DJANGO_KV_ENCRYPTION_KEY=raw):
+            assert encryption._get_fernet_key() == base64.urlsafe_b64encode(raw)
+        with override_settings(DJANGO_KV_ENCRYPTION_KEY="settings-secret"):
+            assert encryption._get_fernet_key() == (
+                encryption._derive_fernet_key_from_secret_key("settings-secret")
+            )
+
+
+class TestFernetWrappers:
+    """Tests for wrapping stores with Fernet encryption."""
+
+    def test_async_wrapper_round_trip(self):
+        """Test that the async wrapper encrypts at rest and decrypts on read."""
+        import asyncio
+
+        from key_value.aio.stores.memory import MemoryStore
+
+        store = MemoryStore()
+        wrapped = encryption.wrap_async_with_fernet(store, key="secret")
+
+        async def run():
+            await wrapped.put(key="k", value={"token": "abc"}, collection="c")
+            return await store.get(key="k", collection="c"), await wrapped.get(
+                key="k", collection="c"
+            )
+
+        raw, decrypted = asyncio.run(run())
+        assert raw != {"token": "abc"}
+        assert decrypted == {"token": "abc"}
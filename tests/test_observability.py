@@ -2,41 +2,28 @@
 Tests for OpenTelemetry instrumentation.
 """
 
+import subprocess
+import sys
+
 import pytest
 from django.test import override_settings
 
-from opentelemetry import trace
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import SimpleSpanProcessor
-from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
-
-from django_kv import observability
-from django_kv.backends.memory import MemoryCacheBackend
-from django_kv.sessions import SessionStore
+pytest.importorskip("opentelemetry.sdk.trace.export.in_memory_span_exporter")
 
+from django_kv import observability  # noqa: E402
+from django_kv.backends.memory import MemoryCacheBackend  # noqa: E402
+from django_kv.sessions import SessionStore  # noqa: E402
 
-@pytest.fixture(scope="module")
-def _otel_exporter_module():
-    exporter = InMemorySpanExporter()
-    provider = TracerProvider()
-    provider.add_span_processor(SimpleSpanProcessor(exporter))
-    # OpenTelemetry does not allow overriding providers without clearing the global.
-    if hasattr(trace, "_TRACER_PROVIDER"):
-        trace._TRACER_PROVIDER = None  # type: ignore[attr-defined]
-    trace.set_tracer_provider(provider)
-    yield exporter
-    exporter.clear()
-    if hasattr(trace, "_TRACER_PROVIDER"):
-        trace._TRACER_PROVIDER = None  # type: ignore[attr-defined]
+pytestmark = pytest.mark.otel
 
 
 @pytest.fixture()
-def otel_exporter(_otel_exporter_module):
-    _otel_exporter_module.clear()
-    yield _otel_exporter_module
+def otel_exporter(otel_provider):
+    _, exporter = otel_provider
+    exporter.clear()
+    yield exporter
 
 
-@pytest.mark.django_db
 @override_settings(DJANGO_KV_OTEL={"ENABLED": True, "METRICS_ENABLED": False})
 def test_cache_spans_emitted(otel_exporter):
     observability.reload_config()
@@ -49,7 +36,357 @@ def test_cache_spans_emitted(otel_exporter):
     assert "django_kv.cache.get" in names
 
 
-@pytest.mark.django_db
+@override_settings(DJANGO_KV_OTEL={"ENABLED": True, "METRICS_ENABLED": False})
+def test_cache_span_attributes(otel_exporter):
+    observability.reload_config()
+    backend = MemoryCacheBackend(collection="otel_cache")
+    backend.set("otel:key", "value", timeout=30)
+    backend.get("otel:key")
+
+    spans = {span.name: span for span in otel_exporter.get_finished_spans()}
+    get_attrs = spans["django_kv.cache.get"].attributes
+    assert get_attrs["django_kv.cache.key"] == backend._make_key("otel:key")
+    assert get_attrs["django_kv.cache.hit"] is True
+    assert spans["django_kv.cache.set"].attributes["django_kv.cache.ttl"] == 30.0
+
+
+@override_settings(DJANGO_KV_OTEL={"ENABLED": True, "METRICS_ENABLED": False})
+def test_async_cache_spans_emitted(otel_exporter):
+    import asyncio
+
+    from django_kv.backends.async_memory import AsyncMemoryCacheBackend
+
+    observability.reload_config()
+    backend = AsyncMemoryCacheBackend(collection="otel_cache")
+
+    async def run():
+        await backend.aset("otel:key", "value", timeout=30)
+        return await backend.aget("otel:key")
+
+    assert asyncio.run(run()) == "value"
+    names = [span.name for span in otel_exporter.get_finished_spans()]
+    assert "django_kv.cache.set" in names
+    assert "django_kv.cache.get" in names
+
+
+@override_settings(DJANGO_KV_OTEL={"ENABLED": False})
+def test_async_cache_skips_spans_when_disabled(otel_exporter):
+    import asyncio
+
+    from django_kv.backends.async_memory import AsyncMemoryCacheBackend
+
+    observability.reload_config()
+    assert observability.TRACING_ENABLED is False
+    backend = AsyncMemoryCacheBackend(collection="otel_cache")
+
+    async def run():
+        await backend.aset("otel:key", "value", timeout=30)
+        return await backend.aget("otel:key")
+
+    assert asyncio.run(run()) == "value"
+    assert otel_exporter.get_finished_spans() == ()
+
+
+@override_settings(DJANGO_KV_OTEL={"ENABLED": False})
+def test_cache_span_is_null_when_disabled(otel_exporter, monkeypatch):
+    from django_kv.backends import base
+
+    observability.reload_config()
+    assert observability.cache_span("get", "MemoryCacheBackend") is observability.NULL_SPAN
+
+    def fail(*args, **kwargs):
+        raise AssertionError("instrumentation should be skipped when tracing is off")
+
+    monkeypatch.setattr(base, "cache_span", fail)
+    monkeypatch.setattr(base, "record_cache_metrics", fail)
+    backend = MemoryCacheBackend(collection="otel_cache")
+    backend.set("otel:key", "value", timeout=30)
+    assert backend.get("otel:key") == "value"
+    assert otel_exporter.get_finished_spans() == ()
+
+
+@override_settings(DJANGO_KV_OTEL={"ENABLED": True, "METRICS_ENABLED": False})
+def test_cache_span_records_errors(otel_exporter):
+    from opentelemetry.trace import StatusCode
+
+    observability.reload_config()
+    with pytest.raises(ValueError):
+        with observability.cache_span("get", "MemoryCacheBackend", "otel_cache"):
+            raise ValueError("boom")
+
+    (span,) = otel_exporter.get_finished_spans()
+    assert span.name == "django_kv.cache.get"
+    assert span.attributes["django_kv.cache.collection"] == "otel_cache"
+    assert span.status.status_code is StatusCode.ERROR
+
+
+@override_settings(DJANGO_KV_OTEL={"ENABLED": False})
+def test_session_span_is_null_when_disabled():
+    observability.reload_config()
+    assert observability.session_span("load", "abc") is observability.NULL_SPAN
+
+
+class _FakeCounter:
+    def __init__(self, name):
+        self.name = name
+        self.adds = []
+
+    def add(self, amount, attributes=None):
+        self.adds.append((amount, attributes))
+
+
+class _FakeMeter:
+    def __init__(self):
+        self.counters = {}
+
+    def create_counter(self, name, description=""):
+        return self.counters.setdefault(name, _FakeCounter(name))
+
+
+@pytest.fixture()
+def fake_meter(monkeypatch):
+    meter = _FakeMeter()
+    with override_settings(DJANGO_KV_OTEL={"ENABLED": True}):
+        observability.reload_config()
+        monkeypatch.setattr(observability, "_get_meter", lambda: meter)
+        yield meter
+    observability.reload_config()
+
+
+def test_metric_attributes_are_shared(fake_meter):
+    observability.record_cache_metrics("get", "MemoryCacheBackend", hit=True)
+    observability.record_cache_metrics("get", "MemoryCacheBackend", hit=False)
+    observability.record_session_metrics("load", True)
+    observability.record_session_metrics("load", True)
+
+    requests = fake_meter.counters["django_kv.cache.requests"].adds
+    assert [amount for amount, _ in requests] == [1, 1]
+    assert requests[0][1] is requests[1][1]
+    assert requests[0][1] == {
+        "django_kv.cache.backend": "MemoryCacheBackend",
+        "django_kv.cache.operation": "get",
+    }
+    sessions = fake_meter.counters["django_kv.session.operations"].adds
+    assert sessions[0][1] is sessions[1][1]
+
+
+def test_cache_metrics_single_add_per_counter(fake_meter):
+    observability.record_cache_metrics("get_many", "MemoryCacheBackend", hit_count=3, miss_count=0)
+    observability.record_cache_metrics("get", "MemoryCacheBackend", hit=False)
+    observability.record_cache_metrics("set", "MemoryCacheBackend", error=True)
+
+    counters = fake_meter.counters
+    assert [a for a, _ in counters["django_kv.cache.requests"].adds] == [1, 1, 1]
+    assert [a for a, _ in counters["django_kv.cache.hits"].adds] == [3]
+    assert [a for a, _ in counters["django_kv.cache.misses"].adds] == [1]
+    assert [a for a, _ in counters["django_kv.cache.errors"].adds] == [1]
+
+
+def test_round_robin_span_processor():
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    from django_kv.otel import _RoundRobinSpanProcessor
+
+    exporters = [InMemorySpanExporter(), InMemorySpanExporter()]
+    provider = TracerProvider()
+    provider.add_span_processor(
+        _RoundRobinSpanProcessor([SimpleSpanProcessor(exporter) for exporter in exporters])
+    )
+    tracer = provider.get_tracer("test")
+    for i in range(4):
+        with tracer.start_as_current_span(f"span-{i}"):
+            pass
+
+    assert [len(exporter.get_finished_spans()) for exporter in exporters] == [2, 2]
+    provider.shutdown()
+
+
+def test_session_sampling_rate(monkeypatch):
+    with override_settings(DJANGO_KV_OTEL={"ENABLED": True, "SESSION_SAMPLING_RATE": 0}):
+        assert observability._SESSIONS_ON is False
+    with override_settings(DJANGO_KV_OTEL={"ENABLED": True, "SESSION_SAMPLING_RATE": 0.25}):
+        monkeypatch.setattr(observability, "random", lambda: 0.5)
+        assert observability.session_span("load", "abc") is observability.NULL_SPAN
+        monkeypatch.setattr(observability, "random", lambda: 0.1)
+        assert observability.session_span("load", "abc") is not observability.NULL_SPAN
+
+
+@override_settings(DJANGO_KV_OTEL={"ENABLED": True, "METRICS_ENABLED": False})
+def test_noop_provider_skips_spans(monkeypatch):
+    from opentelemetry import trace
+
+    monkeypatch.setattr(trace, "get_tracer_provider", lambda: trace.NoOpTracerProvider())
+    observability.reload_config()
+    assert observability.cache_span("get", "MemoryCacheBackend") is observability.NULL_SPAN
+    assert observability.session_span("load", "abc") is observability.NULL_SPAN
+    monkeypatch.undo()
+    observability.reload_config()
+    assert observability.cache_span("get", "MemoryCacheBackend") is not observability.NULL_SPAN
+
+
+def test_cache_metrics_batched_per_request(fake_meter):
+    from django.core.signals import request_finished, request_started
+
+    request_started.send(sender=None)
+    try:
+        observability.record_cache_metrics("get", "MemoryCacheBackend", hit=True)
+        observability.record_cache_metrics("get", "MemoryCacheBackend", hit=False)
+        observability.record_cache_metrics("get", "MemoryCacheBackend", error=True)
+        assert "django_kv.cache.requests" not in fake_meter.counters
+    finally:
+        request_finished.send(sender=None)
+
+    counters = fake_meter.counters
+    assert [a for a, _ in counters["django_kv.cache.requests"].adds] == [3]
+    assert [a for a, _ in counters["django_kv.cache.hits"].adds] == [1]
+    assert [a for a, _ in counters["django_kv.cache.misses"].adds] == [1]
+    assert [a for a, _ in counters["django_kv.cache.errors"].adds] == [1]
+    # Outside a request, metrics are recorded immediately
+    observability.record_cache_metrics("set", "MemoryCacheBackend")
+    assert len(counters["django_kv.cache.requests"].adds) == 2
+
+
+def test_ring_buffer_span_processor():
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    from django_kv.otel import _RingBufferSpanProcessor
+
+    exporter = InMemorySpanExporter()
+    processor = _RingBufferSpanProcessor(exporter, capacity=2, schedule_delay_millis=60_000)
+    provider = TracerProvider()
+    provider.add_span_processor(processor)
+    tracer = provider.get_tracer("test")
+    for i in range(3):
+        with tracer.start_as_current_span(f"span-{i}"):
+            pass
+
+    assert exporter.get_finished_spans() == ()
+    assert processor.dropped == 1
+    assert processor.force_flush() is True
+    assert [span.name for span in exporter.get_finished_spans()] == ["span-1", "span-2"]
+    provider.shutdown()
+
+
+def test_ring_buffer_counts_drops_across_threads():
+    import threading
+
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    from django_kv.otel import _RingBufferSpanProcessor
+
+    exporter = InMemorySpanExporter()
+    processor = _RingBufferSpanProcessor(exporter, capacity=10, schedule_delay_millis=60_000)
+    for i in range(10):
+        processor.on_end(i)
+
+    def end_spans():
+        for i in range(500):
+            processor.on_end(i)
+
+    threads = [threading.Thread(target=end_spans) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert processor.dropped == 8 * 500
+    assert processor.force_flush() is True
+    assert len(exporter.get_finished_spans()) == 10
+    processor.shutdown()
+
+
+def test_ring_buffer_restarts_after_fork():
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    from django_kv import otel
+
+    processor = otel._RingBufferSpanProcessor(InMemorySpanExporter(), schedule_delay_millis=60_000)
+    assert processor in otel._ring_processors
+    thread, shutdown = processor._thread, processor._shutdown
+    processor.on_end("queued-in-parent")
+    otel._after_fork()
+    assert len(processor._buffer) == 0
+    assert processor._thread is not thread and processor._thread.is_alive()
+    assert processor._shutdown is not shutdown and not processor._shutdown.is_set()
+    processor.shutdown()
+    thread_after_shutdown = processor._thread
+    otel._after_fork()
+    assert processor._shutdown.is_set() and processor._thread is thread_after_shutdown
+    shutdown.set()
+    thread.join()
+
+
+def test_init_fast_tracing_accepts_ring_capacity(monkeypatch):
+    from django_kv import otel
+
+    calls = []
+    monkeypatch.setattr(otel, "init_tracing", lambda **kwargs: calls.append(kwargs))
+    otel.init_fast_tracing("svc", ring_capacity=128)
+    otel.init_fast_tracing("svc", capacity=64)
+    assert [(c["ring_capacity"], c["fast_path"]) for c in calls] == [(128, True), (64, True)]
+
+
+def test_session_metrics_recorded_once(fake_meter, monkeypatch):
+    store = SessionStore()
+    store["user"] = "alice"
+    store.save()
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("store down")
+
+    monkeypatch.setattr(store._cache, "set", fail)
+    with pytest.raises(RuntimeError):
+        store.save()
+
+    adds = fake_meter.counters["django_kv.session.operations"].adds
+    outcomes = [(a["django_kv.session.operation"], a["django_kv.session.success"]) for _, a in adds]
+    assert ("save", True) in outcomes
+    assert outcomes.count(("save", False)) == 1
+    assert outcomes[-1] == ("save", False)
+
+
+@pytest.mark.usefixtures("session_cache_aliases")
+@override_settings(DJANGO_KV_SESSION_CACHE_ALIAS="async_sessions")
+def test_async_new_session_save_records_one_success(fake_meter):
+    from django_kv.sessions_async import AsyncSessionStore
+
+    store = AsyncSessionStore()
+    store["user"] = "alice"
+    store.save()
+
+    assert store.session_key is not None
+    assert AsyncSessionStore(session_key=store.session_key)["user"] == "alice"
+    adds = fake_meter.counters["django_kv.session.operations"].adds
+    outcomes = [(a["django_kv.session.operation"], a["django_kv.session.success"]) for _, a in adds]
+    assert outcomes.count(("save", True)) == 1
+    assert ("save", False) not in outcomes
+
+
+def test_feature_flags_follow_config():
+    with override_settings(DJANGO_KV_OTEL={"ENABLED": True, "INSTRUMENT_SESSIONS": False}):
+        observability.reload_config()
+        assert observability._CACHE_ON is True
+        assert observability._SESSIONS_ON is False
+        assert observability._METRICS_ON is True
+    with override_settings(DJANGO_KV_OTEL={"ENABLED": False}):
+        observability.reload_config()
+        assert not (
+            observability._CACHE_ON or observability._SESSIONS_ON or observability._METRICS_ON
+        )
+
+
+def test_config_reloads_on_setting_changed():
+    with override_settings(DJANGO_KV_OTEL={"ENABLED": True, "INSTRUMENT_CACHE": False}):
+        cfg = observability._load_config()
+        assert cfg.enabled is True and cfg.instrument_cache is False
+        assert observability._CACHE_ON is False and observability._SESSIONS_ON is True
+    assert observability._load_config().enabled is False
+    assert observability.TRACING_ENABLED is False
+
+
 @override_settings(DJANGO_KV_OTEL={"ENABLED": True, "METRICS_ENABLED": False})
 def test_session_spans_emitted(otel_exporter):
     observability.reload_config()
@@ -81,3 +418,15 @@ def test_auto_instrument_django(monkeypatch):
     # second call should be no-op
     assert observability.auto_instrument_django() is False
     assert called["count"] == 1
+
+
+def test_config_loaded_on_import():
+    """Span helpers honour DJANGO_KV_OTEL before any cache backend is constructed."""
+    code = (
+        "from django.conf import settings\n"
+        "settings.configure(DJANGO_KV_OTEL={'ENABLED': True})\n"
+        "from django_kv import observability\n"
+        "assert observability._CACHE_ON and observability._SESSIONS_ON\n"
+        "assert observability._METRICS_ON\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -2,49 +2,54 @@
 Tests for serialization functionality.
 """
 
+import importlib.util
+
 import pytest
 from django.test import override_settings
 from django.core.cache import cache
 
+_MSGPACK_MISSING = importlib.util.find_spec("ormsgpack") is None
+
 
-@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "serializer",
+    [
+        "pickle",
+        pytest.param(
+            "msgpack", marks=pytest.mark.skipif(_MSGPACK_MISSING, reason="ormsgpack not installed")
+        ),
+    ],
+)
 class TestSerialization:
     """Tests for value serialization."""
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
-    def test_json_serializable_types(self):
-        """Test that JSON-serializable types use JSON."""
-        # String
-        cache.set("str", "test", timeout=60)
-        assert cache.get("str") == "test"
-
-        # Number
-        cache.set("num", 42, timeout=60)
-        assert cache.get("num") == 42
-
-        # Dict
-        cache.set("dict", {"key": "value"}, timeout=60)
-        assert cache.get("dict") == {"key": "value"}
-
-        # List
-        cache.set("list", [1, 2, 3], timeout=60)
-        assert cache.get("list") == [1, 2, 3]
-
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
+    @pytest.fixture(autouse=True)
+    def serializer_cache(self, serializer):
+        with override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
+                    "COLLECTION": "test_cache",
+                    "SERIALIZER": serializer,
+                }
             }
-        }
+        ):
+            yield
+
+    @pytest.mark.parametrize(
+        "key,value",
+        [
+            ("str", "test"),
+            ("num", 42),
+            ("dict", {"key": "value"}),
+            ("list", [1, 2, 3]),
+        ],
     )
+    def test_json_serializable_types(self, key, value):
+        """Test that JSON-serializable types round-trip unchanged."""
+        cache.set(key, value, timeout=60)
+        assert cache.get(key) == value
+
     def test_pickle_required_types(self):
         """Test that non-JSON types use pickle."""
         # Set with datetime (requires pickle)
@@ -62,14 +67,6 @@ class TestSerialization:
         retrieved = cache.get("set")
         assert retrieved == test_set
 
-    @override_settings(
-        CACHES={
-            "default": {
-                "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-                "COLLECTION": "test_cache",
-            }
-        }
-    )
     def test_nested_structures(self):
         """Test nested data structures."""
         nested = {"level1": {"level2": {"level3": [1, 2, {"deep": "value"}]}}}
@@ -77,3 +74,241 @@ class TestSerialization:
         retrieved = cache.get("nested")
         assert retrieved == nested
         assert retrieved["level1"]["level2"]["level3"][2]["deep"] == "value"
+
+
+class TestAsyncSerialization:
+    """Tests for AsyncKeyValueCacheBackend value encoding."""
+
+    def _backend(self):
+        from django_kv.backends.async_memory import AsyncMemoryCacheBackend
+
+        return AsyncMemoryCacheBackend(collection="test_cache")
+
+    def test_msgpack_round_trip(self):
+        """Test that msgpack-compatible values are packed to msgpack."""
+        pytest.importorskip("ormsgpack")
+        backend = self._backend()
+        for value in [b"raw", [1, 2, 3], {"key": b"raw"}]:
+            stored = backend._serialize(value)
+            assert stored["type"] == "msgpack"
+            assert backend._deserialize(stored) == value
+
+    def test_scalars_stored_natively(self):
+        """Test that plain scalars skip encoding entirely."""
+        backend = self._backend()
+        for value in ["test", 42, 3.14, True, None]:
+            stored = backend._serialize(value)
+            assert stored == {"type": "json", "data": value}
+            assert backend._deserialize(stored) == value
+
+    def test_pickle_fallback_preserves_types(self):
+        """Test that values msgpack would coerce fall back to pickle."""
+        from datetime import datetime
+
+        pytest.importorskip("ormsgpack")
+        backend = self._backend()
+        for value in [datetime.now(), {1, 2, 3}, (1, 2, 3)]:
+            stored = backend._serialize(value)
+            assert stored["type"] == "pickle"
+            assert backend._deserialize(stored) == value
+
+    def test_binary_types_keep_their_type(self):
+        """Test that top-level and nested bytearrays fall back to pickle."""
+        pytest.importorskip("ormsgpack")
+        backend = self._backend()
+        for value in [bytearray(b"x"), {"a": bytearray(b"x")}, [[bytearray(b"y")]]]:
+            stored = backend._serialize(value)
+            assert stored["type"] == "pickle"
+            restored = backend._deserialize(stored)
+            assert restored == value and type(restored) is type(value)
+        assert backend._serialize({"a": b"x"})["type"] == "msgpack"
+
+    def test_legacy_hex_pickle(self):
+        """Test that hex-encoded pickles written by older releases still load."""
+        import pickle
+
+        backend = self._backend()
+        stored = {"type": "pickle", "data": pickle.dumps({1, 2}).hex()}
+        assert backend._deserialize(stored) == {1, 2}
+
+    def test_raw_bytes_for_bytes_capable_store(self):
+        """Test that payloads skip base64 when the store accepts raw bytes."""
+        from key_value.aio.stores.memory import MemoryStore
+        from django_kv.backends.async_base import AsyncKeyValueCacheBackend
+
+        class BytesStore(MemoryStore):
+            accepts_bytes = True
+
+        backend = AsyncKeyValueCacheBackend(key_value=BytesStore())
+        stored = backend._serialize({1, 2, 3})
+        assert isinstance(stored["data"], bytes)
+        assert backend._deserialize(stored) == {1, 2, 3}
+
+    def test_zstd_compression(self):
+        """Test that values above the threshold are zstd-compressed."""
+        pytest.importorskip("zstandard")
+        from django_kv.backends.async_memory import AsyncMemoryCacheBackend
+
+        backend = AsyncMemoryCacheBackend(params={"COMPRESSION": {"threshold": 64}})
+        small = {"key": "value"}
+        large = {"key": "value" * 1000}
+        assert not backend._serialize(small)["type"].startswith("zstd+")
+        stored = backend._serialize(large)
+        assert stored["type"].startswith("zstd+")
+        assert len(stored["data"]) < 1000
+        assert backend._deserialize(stored) == large
+
+
+class TestSyncPickleEncoding:
+    """Tests for KeyValueCacheBackend pickle encoding."""
+
+    def _backend(self):
+        from django_kv.backends.memory import MemoryCacheBackend
+
+        return MemoryCacheBackend(collection="test_cache")
+
+    def test_pickle_base64(self):
+        """Test that pickles are stored base64-encoded at the highest protocol."""
+        import base64
+        import pickle
+        from datetime import datetime
+
+        backend = self._backend()
+        value = datetime.now()
+        stored = backend._serialize(value)
+        assert stored["type"] == "pickle"
+        assert base64.b64decode(stored["data"]) == pickle.dumps(
+            value, protocol=pickle.HIGHEST_PROTOCOL
+        )
+        assert backend._deserialize(stored) == value
+
+    def test_legacy_hex_pickle(self):
+        """Test that hex-encoded pickles written by older releases still load."""
+        import pickle
+
+        backend = self._backend()
+        stored = {"type": "pickle", "data": pickle.dumps({1, 2, 3}).hex()}
+        assert backend._deserialize(stored) == {1, 2, 3}
+
+    def test_type_dispatch(self):
+        """Test that only exact JSON types are stored as JSON."""
+        from collections import OrderedDict
+
+        from django_kv.backends import base
+
+        backend = self._backend()
+        for value in ["s", 1, 1.5, True, None]:
+            assert backend._serialize(value) == {"type": "json", "data": value}
+        container_type = "json" if base.ormsgpack is None else "msgpack"
+        for value in [[1, "a"], {"a": [1]}]:
+            stored = backend._serialize(value)
+            assert stored["type"] == container_type
+            assert backend._deserialize(stored) == value
+        for value in [(1, 2), OrderedDict(a=1), [{1, 2}]]:
+            stored = backend._serialize(value)
+            assert stored["type"] == "pickle"
+            restored = backend._deserialize(stored)
+            assert restored == value and type(restored) is type(value)
+
+    def test_no_json_probe_for_scalars_or_objects(self, monkeypatch):
+        """Test that only dict/list values can reach the JSON probe."""
+        from datetime import datetime
+
+        from django_kv.backends import base
+
+        def fail(*args, **kwargs):
+            raise AssertionError("json.dumps probe should not run")
+
+        monkeypatch.setattr(base.json, "dumps", fail)
+        backend = self._backend()
+        for value in ["s", 1, 1.5, True, None]:
+            assert backend._serialize(value)["type"] == "json"
+        for value in [datetime.now(), {1, 2}, (1, 2)]:
+            assert backend._serialize(value)["type"] == "pickle"
+
+    def test_msgpack_fast_path(self):
+        """Test that containers and bytes are msgpack-packed when ormsgpack is installed."""
+        from datetime import datetime
+
+        pytest.importorskip("ormsgpack")
+        backend = self._backend()
+        for value in [b"raw", {"key": b"raw", "n": [1, 2.5, None]}]:
+            stored = backend._serialize(value)
+            assert stored["type"] == "msgpack"
+            assert backend._deserialize(stored) == value
+        # Values msgpack would coerce (int dict keys, nested datetimes) still pickle
+        for value in [{1: "a"}, [datetime.now()]]:
+            stored = backend._serialize(value)
+            assert stored["type"] == "pickle"
+            assert backend._deserialize(stored) == value
+
+    def test_msgpack_serializer_extension_types(self):
+        """Test that SERIALIZER 'msgpack' packs tuples, sets and datetimes without pickle."""
+        from datetime import datetime, timezone
+
+        from django_kv.backends.memory import MemoryCacheBackend
+
+        pytest.importorskip("ormsgpack")
+        backend = MemoryCacheBackend(params={"SERIALIZER": "msgpack"})
+        now = datetime.now(timezone.utc)
+        for value in [(1, 2), {1, 2}, frozenset("ab"), now, {"when": [now, (1, {2})]}]:
+            stored = backend._serialize(value)
+            assert stored["type"] == "msgpack"
+            restored = backend._deserialize(stored)
+            assert restored == value and type(restored) is type(value)
+        # Types without an extension code still fall back to pickle
+        assert backend._serialize(1 + 2j)["type"] == "pickle"
+
+    def test_msgpack_serializer_zoned_datetime(self):
+        """Test that datetimes with a zone rather than a fixed UTC offset are pickled."""
+        from datetime import datetime, timedelta
+        from zoneinfo import ZoneInfo
+
+        from django_kv.backends.memory import MemoryCacheBackend
+
+        pytest.importorskip("ormsgpack")
+        backend = MemoryCacheBackend(params={"SERIALIZER": "msgpack"})
+        paris = ZoneInfo("Europe/Paris")
+        when = datetime(2024, 3, 30, 12, 0, tzinfo=paris)
+        for value in [when, {"when": [when]}]:
+            stored = backend._serialize(value)
+            assert stored["type"] == "pickle"
+            assert backend._deserialize(stored) == value
+        restored = backend._deserialize(backend._serialize(when))
+        assert restored.tzinfo is paris
+        # The zone's DST rules survive, not just the offset at the time of writing
+        assert (restored + timedelta(days=1)).utcoffset() == timedelta(hours=2)
+
+    def test_pickle_serializer_skips_msgpack(self):
+        """Test that SERIALIZER 'pickle' keeps containers on JSON."""
+        from django_kv.backends.memory import MemoryCacheBackend
+
+        backend = MemoryCacheBackend(params={"SERIALIZER": "pickle"})
+        assert backend._serialize({"key": [1, 2]})["type"] == "json"
+        assert backend._serialize(b"raw")["type"] == "pickle"
+
+    def test_unknown_serializer(self):
+        """Test that an unsupported SERIALIZER is rejected."""
+        from django_kv.backends.memory import MemoryCacheBackend
+
+        with pytest.raises(ValueError, match="Unknown serializer"):
+            MemoryCacheBackend(params={"SERIALIZER": "yaml"})
+
+    def test_nested_binary_types_round_trip(self):
+        """Test that bytearray/memoryview values msgpack would turn into bytes are pickled."""
+        pytest.importorskip("ormsgpack")
+        backend = self._backend()
+        for value in [{"a": bytearray(b"x")}, [b"raw", [bytearray(b"y")]]]:
+            stored = backend._serialize(value)
+            assert stored["type"] == "pickle"
+            restored = backend._deserialize(stored)
+            assert restored == value and type(restored) is type(value)
+        assert type(backend._deserialize(backend._serialize([bytearray(b"z")]))[0]) is bytearray
+        # Plain bytes still take the msgpack path
+        assert backend._serialize({"a": b"x"})["type"] == "msgpack"
+
+    def test_untagged_dicts_pass_through(self):
+        """Test that raw dicts without a type tag are returned unchanged."""
+        backend = self._backend()
+        assert backend._deserialize({"name": "raw"}) == {"name": "raw"}
+        assert backend._deserialize({}) is None
@@ -7,20 +7,10 @@ from django.test import override_settings
 
 from django_kv.sessions import SessionStore
 
-MEMORY_CACHE = {
-    "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-    "COLLECTION": "sessions",
-}
-
-
-@pytest.mark.django_db
-@override_settings(
-    DJANGO_KV_SESSION_CACHE_ALIAS="memory_sessions",
-    CACHES={
-        "default": MEMORY_CACHE,
-        "memory_sessions": MEMORY_CACHE,
-    },
-)
+pytestmark = pytest.mark.usefixtures("session_cache_aliases")
+
+
+@override_settings(DJANGO_KV_SESSION_CACHE_ALIAS="memory_sessions")
 def test_session_round_trip() -> None:
     store = SessionStore()
     store["user_id"] = 123
@@ -31,18 +21,85 @@ def test_session_round_trip() -> None:
     assert restored["user_id"] == 123
 
 
-@pytest.mark.django_db
-@override_settings(
-    # Exercise default alias fallback (django_kv_sessions)
-    CACHES={
-        "default": MEMORY_CACHE,
-        "django_kv_sessions": MEMORY_CACHE,
-    },
-)
-def test_session_default_alias() -> None:
+def test_session_default_alias(settings) -> None:
+    # Exercise the alias fallback when no explicit session alias is configured
+    settings.DJANGO_KV_SESSION_CACHE_ALIAS = None
     store = SessionStore()
     store["foo"] = "bar"
     store.save()
 
     restored = SessionStore(session_key=store.session_key)
     assert restored["foo"] == "bar"
+
+
+@override_settings(DJANGO_KV_SESSION_CACHE_ALIAS="async_sessions")
+def test_async_session_sync_wrappers() -> None:
+    from django_kv.sessions_async import AsyncSessionStore
+
+    session_key = "a" * 32
+    store = AsyncSessionStore(session_key=session_key)
+    store["user_id"] = 123
+    store.save()
+    assert store.exists(session_key)
+
+    restored = AsyncSessionStore(session_key=session_key)
+    assert restored["user_id"] == 123
+
+    restored.delete()
+    assert not store.exists(session_key)
+
+
+def test_session_alias_follows_setting_changes() -> None:
+    with override_settings(DJANGO_KV_SESSION_CACHE_ALIAS="first_sessions"):
+        assert SessionStore._resolve_cache_alias() == "first_sessions"
+        assert SessionStore._resolve_cache_alias() == "first_sessions"
+        with override_settings(DJANGO_KV_SESSION_CACHE_ALIAS="second_sessions"):
+            assert SessionStore._resolve_cache_alias() == "second_sessions"
+        assert SessionStore._resolve_cache_alias() == "first_sessions"
+
+
+@override_settings(DJANGO_KV_SESSION_CACHE_ALIAS="memory_sessions")
+def test_encrypted_session_wraps_cache_once(monkeypatch) -> None:
+    from django_kv import sessions_encrypted
+
+    wrapped = []
+
+    def fake_wrap(key_value):
+        wrapped.append(key_value)
+        return key_value
+
+    monkeypatch.setattr(sessions_encrypted, "wrap_sync_with_fernet", fake_wrap)
+    first = sessions_encrypted.EncryptedSessionStore()
+    second = sessions_encrypted.EncryptedSessionStore()
+    assert first._cache is second._cache
+    assert len(wrapped) == 1
+
+
+def test_session_stores_share_alias_memo() -> None:
+    from django_kv import sessions
+    from django_kv.sessions_async import AsyncSessionStore
+    from django_kv.sessions_encrypted import EncryptedSessionStore
+
+    stores = (SessionStore, AsyncSessionStore, EncryptedSessionStore)
+    with override_settings(DJANGO_KV_SESSION_CACHE_ALIAS="shared_sessions"):
+        assert [store._resolve_cache_alias() for store in stores] == ["shared_sessions"] * 3
+        assert set(sessions._resolved_aliases) == set(stores)
+    assert sessions._resolved_aliases == {}
+
+
+@override_settings(DJANGO_KV_SESSION_CACHE_ALIAS="async_sessions")
+def test_async_session_sync_wrappers_use_cache_timeout(monkeypatch) -> None:
+    from django_kv import sessions_async
+
+    timeouts = []
+
+    def run_sync(coro, timeout):
+        timeouts.append(timeout)
+        coro.close()
+
+    store = sessions_async.AsyncSessionStore(session_key="b" * 32)
+    monkeypatch.setattr(store._cache, "_sync_timeout", 1.5)
+    monkeypatch.setattr(sessions_async, "_run_sync", run_sync)
+    store.exists("b" * 32)
+    store.delete()
+    assert timeouts == [1.5, 1.5]
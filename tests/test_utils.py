@@ -2,9 +2,25 @@
 Tests for Django KV store utilities.
 """
 
+import pytest
 from django.test import override_settings
 from django_kv.utils import get_kv_store, get_kv_store_config
 
+TEST_CONFIG = {
+    "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
+    "COLLECTION": "test_store",
+}
+
+
+@pytest.fixture(
+    params=[TEST_CONFIG, {**TEST_CONFIG, "OPTIONS": {"KEY_PREFIX": "test_prefix"}}],
+    ids=["plain", "options"],
+)
+def kv_store_config(request):
+    """Apply KV_STORE once per test, with and without an OPTIONS dict."""
+    with override_settings(KV_STORE=request.param):
+        yield request.param
+
 
 class TestUtils:
     """Tests for utility functions."""
@@ -15,15 +31,9 @@ class TestUtils:
             config = get_kv_store_config()
             assert config is None
 
-    def test_get_kv_store_config_with_config(self):
+    def test_get_kv_store_config_with_config(self, kv_store_config):
         """Test get_kv_store_config when KV_STORE is configured."""
-        test_config = {
-            "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-            "COLLECTION": "test_store",
-        }
-        with override_settings(KV_STORE=test_config):
-            config = get_kv_store_config()
-            assert config == test_config
+        assert get_kv_store_config() == kv_store_config
 
     def test_get_kv_store_no_config(self):
         """Test get_kv_store when KV_STORE is not configured."""
@@ -31,44 +41,41 @@ class TestUtils:
             store = get_kv_store()
             assert store is None
 
-    def test_get_kv_store_with_config(self):
+    def test_get_kv_store_with_config(self, kv_store_config):
         """Test get_kv_store when KV_STORE is configured."""
-        test_config = {
-            "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-            "COLLECTION": "test_store",
-        }
-        with override_settings(KV_STORE=test_config):
-            store = get_kv_store()
-            assert store is not None
-            # Verify it's a KeyValue store
-            assert hasattr(store, "get")
-            assert hasattr(store, "put")
-            assert hasattr(store, "delete")
+        store = get_kv_store()
+        assert store is not None
+        # Verify it's a KeyValue store
+        assert hasattr(store, "get")
+        assert hasattr(store, "put")
+        assert hasattr(store, "delete")
 
-    def test_get_kv_store_with_options(self):
-        """Test get_kv_store with OPTIONS dict."""
-        test_config = {
-            "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-            "COLLECTION": "test_store",
-            "OPTIONS": {
-                "KEY_PREFIX": "test_prefix",
-            },
-        }
-        with override_settings(KV_STORE=test_config):
-            store = get_kv_store()
-            assert store is not None
-
-    def test_get_kv_store_direct_usage(self):
+    def test_get_kv_store_direct_usage(self, kv_store_config):
         """Test using the KV store directly."""
-        test_config = {
-            "BACKEND": "django_kv.backends.memory.MemoryCacheBackend",
-            "COLLECTION": "test_store",
-        }
-        with override_settings(KV_STORE=test_config):
-            store = get_kv_store()
-            assert store is not None
+        store = get_kv_store()
+        assert store is not None
+
+        # Use the store directly
+        store.put(key="direct_key", value={"data": "value"}, collection="test_collection")
+        result = store.get(key="direct_key", collection="test_collection")
+        assert result == {"data": "value"}
+
+    def test_get_kv_store_is_memoized(self, kv_store_config):
+        """Test that the same configuration returns the same store instance."""
+        store = get_kv_store()
+        assert get_kv_store() is store
+        store.put(key="shared", value={"data": "value"}, collection="memo")
+        assert get_kv_store().get(key="shared", collection="memo") == {"data": "value"}
+        with override_settings(KV_STORE=dict(kv_store_config)):
+            assert get_kv_store() is not store
+
+    def test_backend_import_is_cached(self, kv_store_config):
+        """Test that the backend class is resolved once per dotted path."""
+        from django_kv import utils
 
-            # Use the store directly
-            store.put(key="direct_key", value={"data": "value"}, collection="test_collection")
-            result = store.get(key="direct_key", collection="test_collection")
-            assert result == {"data": "value"}
+        utils._import_backend.cache_clear()
+        get_kv_store()
+        with override_settings(KV_STORE=dict(kv_store_config)):
+            get_kv_store()
+        info = utils._import_backend.cache_info()
+        assert (info.misses, info.hits) == (1, 1)